@@ -18,6 +18,10 @@ class Association(weakref.ref):
     creating blueprints, and better visual representation.
     """
 
+    # `weakref.ref` itself is slotted; keep subclass instances `__dict__`-free
+    # as well, since one Association exists per wire endpoint
+    __slots__ = ()
+
     Format = Annotated[
         int,
         Field(ge=0, lt=2**64),
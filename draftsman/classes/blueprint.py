@@ -91,7 +91,7 @@ from draftsman.classes.schedule_list import ScheduleList
 from draftsman.classes.spatial_data_structure import SpatialDataStructure
 from draftsman.classes.spatial_hashmap import SpatialHashMap
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.error import (
     DraftsmanError,
     UnreasonablySizedBlueprintError,
@@ -113,6 +113,7 @@ from draftsman.classes.schedule import Schedule
 from draftsman.utils import (
     AABB,
     aabb_to_dimensions,
+    aabb_union,
     encode_version,
     extend_aabb,
     flatten_entities,
@@ -134,6 +135,12 @@ from pydantic import (
 )
 
 
+# Keys trimmed from the exported dict when their values are empty or zeroed
+_OMIT_IF_EMPTY = {"entities", "tiles", "schedules", "wires"}
+_OMIT_IF_ZERO = {"snap-to-grid", "position-relative-to-grid"}
+_ZERO_XY = {"x": 0, "y": 0}
+
+
 def _normalize_internal_structure(
     input_root, entities_in, tiles_in, schedules_in, wires_in
 ):
@@ -146,21 +153,44 @@ def _normalize_internal_structure(
         )
 
     # Entities
-    flattened_entities = flatten_entities(entities_in)
+    # When no Groups are present (the common case), the entity list is already
+    # flat; skip the recursive walk and its per-entity `get()` dispatch
+    has_groups = any(isinstance(entity, EntityCollection) for entity in entities_in)
+    if isinstance(entities_in, EntityList):
+        # Memoized on the list itself; repeated `to_dict()` calls with no
+        # intervening mutation skip the flatten entirely
+        flattened_entities = entities_in.flattened()
+    elif has_groups:
+        flattened_entities = flatten_entities(entities_in)
+    else:
+        flattened_entities = list(entities_in)
     entities_out = []
-    for i, entity in enumerate(flattened_entities):
-        # Get a copy of the dict representation of the Entity
+    for i, entity in enumerate(flattened_entities, 1):
+        # Get the dict representation of the Entity; `to_dict()` returns a
+        # fresh dict owned by us, so it's safe to mutate in-place below
         # (At this point, Associations are not copied and still point to original)
-        # result = entity.to_dict() # copy.deepcopy?
-        # result = copy.deepcopy(entity.to_dict())
         result = entity.to_dict()
         if not isinstance(result, dict):
             raise DraftsmanError(
                 "{}.to_dict() must return a dict".format(type(entity).__name__)
             )
         # Add this to the output's entities and set it's entity_number
+        result["entity_number"] = i
         entities_out.append(result)
-        entities_out[i]["entity_number"] = i + 1
+
+    # Associations are resolved by keying off of each entity's `id()`, which
+    # avoids both a linear scan per endpoint and any (potentially expensive)
+    # `Entity.__eq__` calls
+    entity_index = {id(entity): i + 1 for i, entity in enumerate(flattened_entities)}
+
+    def _resolve_entity_number(resolved):
+        index = entity_index.get(id(resolved))
+        if index is None:
+            # Deepcopied Associations still point at the original entities
+            # (`Association.__deepcopy__` returns itself), so fall back to a
+            # value-equality scan; raises ValueError if truly absent
+            index = flattened_entities.index(resolved) + 1
+        return index
 
     # for entity in entities_out:
     #     if "connections" in entity:  # Wire connections
@@ -201,9 +231,7 @@ def _normalize_internal_structure(
 
     # Tiles (TODO: should also be flattened)
 
-    tiles_out = []
-    for tile in tiles_in:
-        tiles_out.append(tile.to_dict())
+    tiles_out = [tile.to_dict() for tile in tiles_in]
 
     input_root["tiles"] = tiles_out
 
@@ -222,55 +250,53 @@ def _normalize_internal_structure(
     #             # schedules:
     #             recurse_schedules(entitylike.entities)
 
-    schedules_out = []
-    for schedule in schedules_in:
-        schedules_out.append(schedule.to_dict())
+    schedules_out = [schedule.to_dict() for schedule in schedules_in]
 
-    # Change all locomotive associations to use number
+    # Change all locomotive associations to use number; rebuild each list in
+    # one shot instead of storing back element-by-element
     for schedule in schedules_out:
-        for i, locomotive in enumerate(schedule["locomotives"]):
-            if locomotive() is None:  # pragma: no coverage
+        resolved_locomotives = [locomotive() for locomotive in schedule["locomotives"]]
+        for locomotive, resolved in zip(schedule["locomotives"], resolved_locomotives):
+            if resolved is None:  # pragma: no coverage
                 _throw_invalid_association(locomotive)
-            else:  # Association
-                schedule["locomotives"][i] = flattened_entities.index(locomotive()) + 1
+        schedule["locomotives"] = [
+            _resolve_entity_number(resolved) for resolved in resolved_locomotives
+        ]
 
     input_root["schedules"] = schedules_out
 
     # Wires
+    # Accumulate into a single output list (via closure) rather than
+    # concatenating one intermediate list per nested group
     def flatten_wires(entities_in):
-        wires_out = []
         for entity in entities_in:
             if isinstance(entity, EntityCollection):
-                wires_out.extend(entity.wires)
-                wires_out.extend(flatten_wires(entity.entities))
-            else:
-                pass
-        return wires_out
+                flattened_wires.extend(entity.wires)
+                flatten_wires(entity.entities)
 
     flattened_wires = []
     flattened_wires.extend(wires_in)
-    flattened_wires.extend(flatten_wires(entities_in))
+    if has_groups:
+        flatten_wires(entities_in)
 
     wires_out = []
+    seen_wires = set()
     for wire in flattened_wires:
-        entity_1 = wire[0]
-        if entity_1() is None or entity_1() not in flattened_entities:
-            raise InvalidAssociationError(wire)
-        entity_2 = wire[2]
-        if entity_2() is None or entity_2() not in flattened_entities:
+        resolved_1 = wire[0]()
+        resolved_2 = wire[2]()
+        try:
+            entity_number_1 = _resolve_entity_number(resolved_1)
+            entity_number_2 = _resolve_entity_number(resolved_2)
+        except ValueError:  # None, or no longer in the blueprint
             raise InvalidAssociationError(wire)
 
         # Check to see if this wire already exists in the output, and neglect
         # adding it if so
         # TODO: this should happen earlier... somewhere...
-        new_wire = [
-            flattened_entities.index(entity_1()) + 1,
-            wire[1],
-            flattened_entities.index(entity_2()) + 1,
-            wire[3],
-        ]
-        if new_wire not in wires_out:
-            wires_out.append(new_wire)
+        new_wire = (entity_number_1, wire[1], entity_number_2, wire[3])
+        if new_wire not in seen_wires:
+            seen_wires.add(new_wire)
+            wires_out.append(list(new_wire))
 
     input_root["wires"] = wires_out
 
@@ -458,12 +484,8 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         self,
         blueprint: Union[str, dict] = None,
         index: Optional[uint16] = None,
-        validate: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate: ValidationSetting = ValidationMode.STRICT,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
     ):
         """
         Creates a ``Blueprint`` class. Will load the data from ``blueprint`` if
@@ -508,9 +530,7 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         wires: Optional[list[list[int]]] = None,
         stock_connections: Optional[list[dict]] = None,  # TODO
         index: Optional[uint16] = None,
-        validate: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate: ValidationSetting = ValidationMode.STRICT,
         **kwargs,
     ):
         # self._root.blueprint = Blueprint.Format.BlueprintObject(item="blueprint")
@@ -614,20 +634,24 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         #         for i, neighbour in enumerate(neighbours):
         #             neighbours[i] = Association(self.entities[neighbour - 1])
 
+        # Index the plain backing list directly instead of going through
+        # EntityList.__getitem__'s type dispatch once per endpoint
+        ents = self._root._entities._root
+
         # Change all locomotive numbers to use Associations
         for schedule in self.schedules:
             for i, locomotive in enumerate(schedule.locomotives):
                 if isinstance(locomotive, int):
-                    entity: Entity = self.entities[locomotive - 1]
+                    entity: Entity = ents[locomotive - 1]
                     schedule.locomotives[i] = Association(entity)
 
         # Change all wire numbers to use Associations
         for i, wire in enumerate(self.wires):
             if isinstance(wire[0], int):
-                entity1 = self.entities[wire[0] - 1]
+                entity1 = ents[wire[0] - 1]
                 wire[0] = Association(entity1)
             if isinstance(wire[2], int):
-                entity2 = self.entities[wire[2] - 1]
+                entity2 = ents[wire[2] - 1]
                 wire[2] = Association(entity2)
             # self.wires[i] = [Association(entity1), wire[1], Association(entity2), wire[3]]
 
@@ -668,7 +692,7 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
             print(blueprint.label_color)
             # {'r': 127.0, 'g': 127.0, 'b': 127.0}
         """
-        return self._root[self._root_item].get("label_color", None)
+        return self._root_obj.get("label_color", None)
 
     @label_color.setter
     def label_color(self, value: Optional[Color]):
@@ -677,13 +701,13 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
             result = attempt_and_reissue(
                 self,
                 self.Format.BlueprintObject,
-                self._root.blueprint,
+                self._root_obj,
                 "label_color",
                 value,
             )
-            self._root[self._root_item]["label_color"] = result
+            self._root_obj["label_color"] = result
         else:
-            self._root[self._root_item]["label_color"] = value
+            self._root_obj["label_color"] = value
 
     # =========================================================================
 
@@ -702,7 +726,7 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
             set to ``None``
         """
         # return self._root[self._root_item].get("snap-to-grid", None)
-        return self._root.blueprint._snap_to_grid
+        return self._root_obj._snap_to_grid
 
     @snapping_grid_size.setter
     def snapping_grid_size(self, value: Union[Vector, PrimitiveVector, None]):
@@ -718,9 +742,9 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         # else:
         #     self._root[self._root_item]["snapping_grid_size"] = value
         if value is None:
-            self._root.blueprint._snap_to_grid.update_from_other((0, 0), int)
+            self._root_obj._snap_to_grid.update_from_other((0, 0), int)
         else:
-            self._root.blueprint._snap_to_grid.update_from_other(value, int)
+            self._root_obj._snap_to_grid.update_from_other(value, int)
 
     # =========================================================================
 
@@ -741,7 +765,7 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
             attribute if set to ``None``.
         """
         # return self._root[self._root_item].get("snapping_grid_position", None)
-        return self._root.blueprint._snapping_grid_position
+        return self._root_obj._snapping_grid_position
 
     @snapping_grid_position.setter
     def snapping_grid_position(self, value: Union[Vector, PrimitiveVector, None]):
@@ -750,9 +774,9 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         # else:
         #     self._root[self._root_item]["snapping_grid_position"].update_from_other(value, int)
         if value is None:
-            self._root.blueprint._snapping_grid_position.update_from_other((0, 0), int)
+            self._root_obj._snapping_grid_position.update_from_other((0, 0), int)
         else:
-            self._root.blueprint._snapping_grid_position.update_from_other(value, int)
+            self._root_obj._snapping_grid_position.update_from_other(value, int)
 
     # =========================================================================
 
@@ -771,7 +795,7 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         :exception TypeError: If set to anything other than a ``bool`` or
             ``None``.
         """
-        return self._root[self._root_item].get("absolute-snapping", None)
+        return self._root_obj.get("absolute-snapping", None)
 
     @absolute_snapping.setter
     def absolute_snapping(self, value: Optional[bool]):
@@ -779,13 +803,13 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
             result = attempt_and_reissue(
                 self,
                 self.Format.BlueprintObject,
-                self._root.blueprint,
+                self._root_obj,
                 "absolute_snapping",
                 value,
             )
-            self._root[self._root_item]["absolute_snapping"] = result
+            self._root_obj["absolute_snapping"] = result
         else:
-            self._root[self._root_item]["absolute_snapping"] = value
+            self._root_obj["absolute_snapping"] = value
 
     # =========================================================================
 
@@ -800,7 +824,7 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
             ``(0, 0)`` if set to ``None``
         """
         # return self._root[self._root_item]["position-relative-to-grid"]
-        return self._root.blueprint._position_relative_to_grid
+        return self._root_obj._position_relative_to_grid
 
     @position_relative_to_grid.setter
     def position_relative_to_grid(self, value: Union[Vector, PrimitiveVector, None]):
@@ -813,11 +837,11 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         #         value, int
         #     )
         if value is None:
-            self._root.blueprint._position_relative_to_grid.update_from_other(
+            self._root_obj._position_relative_to_grid.update_from_other(
                 (0, 0), int
             )
         else:
-            self._root.blueprint._position_relative_to_grid.update_from_other(
+            self._root_obj._position_relative_to_grid.update_from_other(
                 value, int
             )
 
@@ -847,10 +871,22 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
             # self._root[self._root_item]["entities"].clear()
             self._root._entities.clear()
         elif isinstance(value, EntityList):
-            # Just don't ask
-            # self._root["entities"] = copy.deepcopy(value, memo={"new_parent": self})
-            # self._root[self._root_item]["entities"] = EntityList(self, value._root)
-            self._root._entities = EntityList(self, value._root)
+            if value._parent is None:
+                # The list is orphaned (e.g. the result of a union/
+                # intersection/difference); adopt it wholesale instead of
+                # deep-copying every entity into a fresh list
+                value._parent = self
+                for entitylike in value._root:
+                    entitylike._parent = self
+                value._invalidate_flattened_cache()
+                self._root._entities = value
+            else:
+                # The list still belongs to another collection, so we have to
+                # copy its contents
+                # Just don't ask
+                # self._root["entities"] = copy.deepcopy(value, memo={"new_parent": self})
+                # self._root[self._root_item]["entities"] = EntityList(self, value._root)
+                self._root._entities = EntityList(self, value._root)
         else:
             # self._root[self._root_item]["entities"] = EntityList(self, value)
             self._root._entities = EntityList(self, value)
@@ -966,14 +1002,14 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         """
         TODO
         """
-        return self._root.blueprint.stock_connections
+        return self._root_obj.stock_connections
 
     @stock_connections.setter
     def stock_connections(self, value: Optional[list[dict]]) -> None:
         if value is None:
-            self._root.blueprint.stock_connections = []
+            self._root_obj.stock_connections = []
         else:
-            self._root.blueprint.stock_connections = value
+            self._root_obj.stock_connections = value
 
     # =========================================================================
 
@@ -985,11 +1021,7 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         blueprint has any entities that are double-grid-aligned, the Blueprint
         is considered double-grid-aligned. Read only.
         """
-        for entity in self.entities:
-            if entity.double_grid_aligned:
-                return True
-
-        return False
+        return self.entities.double_grid_aligned
 
     # =========================================================================
     # Utility functions
@@ -1005,14 +1037,10 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         :returns: The smallest :py:class:`.AABB` which encompasses all entities
             and tiles currently contained.
         """
-        area = None
-        for entity in self.entities:
-            area = extend_aabb(area, entity.get_world_bounding_box())
-
-        for tile in self.tiles:
-            area = extend_aabb(area, tile.get_world_bounding_box())
-
-        return area
+        return extend_aabb(
+            aabb_union(entity.get_world_bounding_box() for entity in self.entities),
+            aabb_union(tile.get_world_bounding_box() for tile in self.tiles),
+        )
 
     def get_dimensions(self) -> tuple[int, int]:
         """
@@ -1091,17 +1119,22 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         #         out_model.blueprint.position_relative_to_grid.to_dict()
         #     )
 
-        # Make sure that snapping_grid_position is respected
-        # if self.snapping_grid_position is not None:
-        # Offset Entities
-        for entity in result["blueprint"]["entities"]:
-            entity["position"]["x"] -= self.snapping_grid_position.x
-            entity["position"]["y"] -= self.snapping_grid_position.y
-
-        # Offset Tiles
-        for tile in result["blueprint"]["tiles"]:
-            tile["position"]["x"] -= self.snapping_grid_position.x
-            tile["position"]["y"] -= self.snapping_grid_position.y
+        # Make sure that snapping_grid_position is respected; skip the passes
+        # entirely in the common zero-offset case
+        offset_x = self.snapping_grid_position.x
+        offset_y = self.snapping_grid_position.y
+        if offset_x != 0 or offset_y != 0:
+            # Offset Entities
+            for entity in result["blueprint"]["entities"]:
+                position = entity["position"]
+                position["x"] -= offset_x
+                position["y"] -= offset_y
+
+            # Offset Tiles
+            for tile in result["blueprint"]["tiles"]:
+                position = tile["position"]
+                position["x"] -= offset_x
+                position["y"] -= offset_y
 
         # # We then create an output dict
         # out_dict = out_model.model_dump(
@@ -1115,42 +1148,41 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         # print(self.snapping_grid_size)
         # print(self.position_relative_to_grid)
 
-        if "snap-to-grid" in result["blueprint"] and result["blueprint"][
-            "snap-to-grid"
-        ] == {"x": 0, "y": 0}:
-            del result["blueprint"]["snap-to-grid"]
-        if "position-relative-to-grid" in result["blueprint"] and result["blueprint"][
-            "position-relative-to-grid"
-        ] == {"x": 0, "y": 0}:
-            del result["blueprint"]["position-relative-to-grid"]
-
-        if len(result["blueprint"]["entities"]) == 0:
-            del result["blueprint"]["entities"]
-        if len(result["blueprint"]["tiles"]) == 0:
-            del result["blueprint"]["tiles"]
-        if len(result["blueprint"]["schedules"]) == 0:
-            del result["blueprint"]["schedules"]
-        if len(result["blueprint"]["wires"]) == 0:
-            del result["blueprint"]["wires"]
+        # Strip empty containers and zeroed grid defaults in one rebuild pass
+        # rather than a lookup-plus-delete per key
+        result["blueprint"] = {
+            k: v
+            for k, v in result["blueprint"].items()
+            if not (k in _OMIT_IF_EMPTY and not v)
+            and not (k in _OMIT_IF_ZERO and v == _ZERO_XY)
+        }
 
         return result
 
     # =========================================================================
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Blueprint):
             return NotImplemented
 
+        # Compare the cheap scalar attributes first so that (typically) unequal
+        # blueprints are distinguished before the O(n) list comparisons
         return (
-            self.label == other.label
+            self.version == other.version
+            and self.label == other.label
             and self.label_color == other.label_color
             and self.description == other.description
             and self.icons == other.icons
-            and self.version == other.version
             and self.snapping_grid_size == other.snapping_grid_size
             and self.snapping_grid_position == other.snapping_grid_position
             and self.absolute_snapping == other.absolute_snapping
             and self.position_relative_to_grid == other.position_relative_to_grid
+            and len(self.entities) == len(other.entities)
+            and len(self.tiles) == len(other.tiles)
+            and len(self.schedules) == len(other.schedules)
             and self.entities == other.entities
             and self.tiles == other.tiles
             and self.schedules == other.schedules
@@ -1202,5 +1234,6 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
 
         setattr(result, "_root", root_copy)
         setattr(result, "_root_item", self._root_item)
+        setattr(result, "_root_obj", root_copy[self._root_item])
 
         return result
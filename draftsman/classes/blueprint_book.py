@@ -64,7 +64,7 @@ from draftsman.classes.blueprintable import Blueprintable
 from draftsman.classes.deconstruction_planner import DeconstructionPlanner
 from draftsman.classes.exportable import ValidationResult, attempt_and_reissue
 from draftsman.classes.upgrade_planner import UpgradePlanner
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.error import DataFormatError
 from draftsman.signatures import Color, DraftsmanBaseModel, Icon, uint16, uint64
 from draftsman.utils import encode_version, reissue_warnings
@@ -260,12 +260,8 @@ class BlueprintBook(Blueprintable):
         self,
         blueprint_book: Optional[Union[str, dict]] = None,
         index: Optional[uint16] = None,
-        validate: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate: ValidationSetting = ValidationMode.STRICT,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
     ):
         """
         Creates a ``BlueprintBook`` class. Will load the data from
@@ -300,9 +296,7 @@ class BlueprintBook(Blueprintable):
         active_index: Optional[uint16] = 0,
         blueprints: Union[BlueprintableList, list[Blueprintable], list[dict]] = [],
         index: Optional[uint16] = None,
-        validate: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         # self._root = {}
@@ -379,7 +373,7 @@ class BlueprintBook(Blueprintable):
             print(blueprint.label_color)
             # {'r': 127.0, 'g': 127.0, 'b': 127.0}
         """
-        return self._root[self._root_item].get("label_color", None)
+        return self._root_obj.get("label_color", None)
 
     @label_color.setter
     def label_color(self, value: Optional[Color]):
@@ -387,20 +381,20 @@ class BlueprintBook(Blueprintable):
             result = attempt_and_reissue(
                 self,
                 self._root_format,
-                self._root[self._root_item],
+                self._root_obj,
                 "label_color",
                 value,
             )
-            self._root[self._root_item]["label_color"] = result
+            self._root_obj["label_color"] = result
         else:
-            self._root[self._root_item]["label_color"] = value
+            self._root_obj["label_color"] = value
 
     def set_label_color(self, r, g, b, a=None):  # TODO: remove
         """
         TODO
         """
         try:
-            self._root[self._root_item]["label_color"] = Color(r=r, g=g, b=b, a=a)
+            self._root_obj["label_color"] = Color(r=r, g=g, b=b, a=a)
         except ValidationError as e:
             raise DataFormatError from e
 
@@ -420,7 +414,7 @@ class BlueprintBook(Blueprintable):
         :exception TypeError: If set to anything other than an ``int`` or
             ``None``.
         """
-        return self._root[self._root_item].get("active_index", None)
+        return self._root_obj.get("active_index", None)
 
     @active_index.setter
     def active_index(self, value: Optional[uint16]):
@@ -428,13 +422,13 @@ class BlueprintBook(Blueprintable):
             result = attempt_and_reissue(
                 self,
                 self._root_format,
-                self._root[self._root_item],
+                self._root_obj,
                 "active_index",
                 value,
             )
-            self._root[self._root_item]["active_index"] = result
+            self._root_obj["active_index"] = result
         else:
-            self._root[self._root_item]["active_index"] = value
+            self._root_obj["active_index"] = value
 
     # =========================================================================
 
@@ -475,9 +469,7 @@ class BlueprintBook(Blueprintable):
 
     def validate(
         self,
-        mode: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        mode: ValidationSetting = ValidationMode.STRICT,
         force: bool = False,
     ) -> ValidationResult:
         mode = ValidationMode(mode)
@@ -504,6 +496,7 @@ class BlueprintBook(Blueprintable):
             result._blueprints = self._root._blueprints
             # Acquire the newly converted data
             self._root = result
+            self._root_obj = self._root[self._root_item]
         except ValidationError as e:
             output.error_list.append(DataFormatError(e))
 
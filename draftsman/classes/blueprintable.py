@@ -8,8 +8,12 @@ from draftsman.classes.exportable import (
     apply_assignment,
     test_replace_me,
 )
-from draftsman.constants import ValidationMode
-from draftsman.error import DataFormatError, IncorrectBlueprintTypeError
+from draftsman.constants import ValidationMode, ValidationSetting
+from draftsman.error import (
+    DataFormatError,
+    IncorrectBlueprintTypeError,
+    InvalidSignalError,
+)
 from draftsman.signatures import (
     DraftsmanBaseModel,
     Icon,
@@ -50,9 +54,7 @@ class Blueprintable(Exportable, metaclass=ABCMeta):
         root_item: str,
         init_data: Union[str, dict, None],
         index: uint16,
-        validate: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -71,14 +73,22 @@ class Blueprintable(Exportable, metaclass=ABCMeta):
         self._root_item = root_item
         # self._root_format = (root_format,)
         self._root_format = root_format
-        # self._root = self.Format.model_construct(**{self._root_item: {"item": item, **kwargs}})
-        # self._root[self._root_item] = root_format.model_construct(self._root[self._root_item])
-        # Create a Pydantic model instance for quick validation (at the cost of
-        # startup time and memory)
-        self._root = self.Format.model_validate(
-            {self._root_item: {"item": root_item, **kwargs}, "index": index},
-            context={"construction": True, "mode": ValidationMode.NONE},
+        # Create a Pydantic model instance to hold the root data. The inputs
+        # here are known-good defaults (any user data is run through `setup()`
+        # afterwards), so we can use `model_construct` and skip field
+        # validation entirely
+        self._root = self.Format.model_construct(
+            **{
+                self._root_item: root_format.model_construct(
+                    **{"item": root_item, **kwargs}
+                ),
+                "index": index,
+            }
         )
+        # Cache the root-item sub-model; `self._root[self._root_item]` pays an
+        # alias-map rebuild plus getattr on every property access otherwise.
+        # Any code which swaps out `self._root` must refresh this reference
+        self._root_obj = self._root[self._root_item]
         # print("blueprintable")
         # print(self._root)
 
@@ -107,9 +117,7 @@ class Blueprintable(Exportable, metaclass=ABCMeta):
     def load_from_string(
         self,
         string: str,
-        validate: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate: ValidationSetting = ValidationMode.STRICT,
     ):
         """
         Load the :py:class:`.Blueprintable` with the contents of ``string``.
@@ -205,7 +213,7 @@ class Blueprintable(Exportable, metaclass=ABCMeta):
             >>> BlueprintBook().item
             'blueprint-book'
         """
-        return self._root[self._root_item]["item"]
+        return self._root_obj["item"]
 
     # =========================================================================
 
@@ -220,14 +228,14 @@ class Blueprintable(Exportable, metaclass=ABCMeta):
         :exception TypeError: When setting ``label`` to something other than
             ``str`` or ``None``.
         """
-        return self._root[self._root_item]["label"]
+        return self._root_obj["label"]
 
     @label.setter
     def label(self, value: Optional[str]):
         test_replace_me(
             self,
             self._root_format,
-            self._root[self._root_item],
+            self._root_obj,
             "label",
             value,
             self.validate_assignment,
@@ -255,7 +263,7 @@ class Blueprintable(Exportable, metaclass=ABCMeta):
         :exception TypeError: If setting to anything other than a ``str`` or
             ``None``.
         """
-        return self._root[self._root_item].get("description", None)
+        return self._root_obj.get("description", None)
 
     @description.setter
     def description(self, value: Optional[str]):
@@ -263,13 +271,13 @@ class Blueprintable(Exportable, metaclass=ABCMeta):
             result = attempt_and_reissue(
                 self,
                 self._root_format,
-                self._root[self._root_item],
+                self._root_obj,
                 "description",
                 value,
             )
-            self._root[self._root_item]["description"] = result
+            self._root_obj["description"] = result
         else:
-            self._root[self._root_item]["description"] = value
+            self._root_obj["description"] = value
 
     # =========================================================================
 
@@ -305,14 +313,14 @@ class Blueprintable(Exportable, metaclass=ABCMeta):
             >>> blueprint.icons
             [{'index': 1, 'signal': {'name': 'transport-belt', 'type': 'item'}}]
         """
-        return self._root[self._root_item]["icons"]
+        return self._root_obj["icons"]
 
     @icons.setter
     def icons(self, value: Union[list[str], list[Icon], None]):
         test_replace_me(
             self,
             self._root_format,
-            self._root[self._root_item],
+            self._root_obj,
             "icons",
             value,
             self.validate_assignment,
@@ -346,6 +354,14 @@ class Blueprintable(Exportable, metaclass=ABCMeta):
         """
         new_icons = [None] * len(icon_names)
         for i, icon in enumerate(icon_names):
+            if isinstance(icon, str):
+                try:
+                    # Resolve the signal name here so the setter's validation
+                    # pass receives an already-normalized SignalID dict
+                    icon = signal_dict(icon)
+                except InvalidSignalError:
+                    # Leave the raw string for validation to complain about
+                    pass
             new_icons[i] = {"index": i + 1, "signal": icon}
         self.icons = new_icons
 
@@ -391,18 +407,18 @@ class Blueprintable(Exportable, metaclass=ABCMeta):
             >>> assert blueprint.version_tuple() == (1, 0, 0, 0)
             >>> assert blueprint.version_string() == "1.0.0.0"
         """
-        return self._root[self._root_item].get("version", None)
+        return self._root_obj.get("version", None)
 
     @version.setter
     def version(self, value: Union[uint64, Sequence[uint16]]):
         value = normalize_version(value)
         if self.validate_assignment:
             result = attempt_and_reissue(
-                self, self._root_format, self._root[self._root_item], "version", value
+                self, self._root_format, self._root_obj, "version", value
             )
-            self._root[self._root_item]["version"] = result
+            self._root_obj["version"] = result
         else:
-            self._root[self._root_item]["version"] = value
+            self._root_obj["version"] = value
 
     # =========================================================================
 
@@ -472,7 +488,7 @@ class Blueprintable(Exportable, metaclass=ABCMeta):
             >>> blueprint.version_tuple()
             (1, 0, 0, 0)
         """
-        return decode_version(self._root[self._root_item]["version"])
+        return decode_version(self._root_obj["version"])
 
     def version_string(self) -> str:
         """
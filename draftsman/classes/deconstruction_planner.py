@@ -47,7 +47,7 @@
 from draftsman import __factorio_version_info__
 from draftsman.classes.blueprintable import Blueprintable
 from draftsman.classes.exportable import ValidationResult, attempt_and_reissue
-from draftsman.constants import FilterMode, TileSelectionMode, ValidationMode
+from draftsman.constants import FilterMode, TileSelectionMode, ValidationMode, ValidationSetting
 from draftsman.data import items
 from draftsman.error import DataFormatError
 from draftsman.warning import IndexWarning, UnknownEntityWarning, UnknownTileWarning
@@ -252,12 +252,8 @@ class DeconstructionPlanner(Blueprintable):
         self,
         deconstruction_planner: Union[str, dict, None] = None,
         index: Optional[uint16] = None,
-        validate: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate: ValidationSetting = ValidationMode.STRICT,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
     ):
         """
         TODO
@@ -282,9 +278,7 @@ class DeconstructionPlanner(Blueprintable):
         version: uint64 = __factorio_version_info__,
         settings: Format.DeconstructionPlannerObject.Settings = {},
         index: Optional[uint16] = None,
-        validate: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         # Item (type identifier)
@@ -345,7 +339,7 @@ class DeconstructionPlanner(Blueprintable):
 
     @property
     def description(self) -> Optional[str]:
-        return self._root[self._root_item]["settings"].get("description", None)
+        return self._root_obj["settings"].get("description", None)
 
     @description.setter
     def description(self, value: Optional[str]):
@@ -353,19 +347,19 @@ class DeconstructionPlanner(Blueprintable):
             result = attempt_and_reissue(
                 self,
                 self.Format.DeconstructionPlannerObject.Settings,
-                self._root[self._root_item]["settings"],
+                self._root_obj["settings"],
                 "description",
                 value,
             )
-            self._root[self._root_item]["settings"]["description"] = result
+            self._root_obj["settings"]["description"] = result
         else:
-            self._root[self._root_item]["settings"]["description"] = value
+            self._root_obj["settings"]["description"] = value
 
     # =========================================================================
 
     @property
     def icons(self) -> Optional[list[Icon]]:
-        return self._root[self._root_item]["settings"].get("icons", None)
+        return self._root_obj["settings"].get("icons", None)
 
     @icons.setter
     def icons(self, value: Union[list[str], list[Icon], None]):
@@ -373,13 +367,13 @@ class DeconstructionPlanner(Blueprintable):
             result = attempt_and_reissue(
                 self,
                 self.Format.DeconstructionPlannerObject.Settings,
-                self._root[self._root_item]["settings"],
+                self._root_obj["settings"],
                 "icons",
                 value,
             )
-            self._root[self._root_item]["settings"]["icons"] = result
+            self._root_obj["settings"]["icons"] = result
         else:
-            self._root[self._root_item]["settings"]["icons"] = value
+            self._root_obj["settings"]["icons"] = value
 
     # =========================================================================
 
@@ -395,7 +389,7 @@ class DeconstructionPlanner(Blueprintable):
         :raises ValueError: If not set to an valid :py:data:`.FilterMode` or
             ``None``.
         """
-        return self._root[self._root_item]["settings"].get("entity_filter_mode", None)
+        return self._root_obj["settings"].get("entity_filter_mode", None)
 
     @entity_filter_mode.setter
     def entity_filter_mode(self, value: Optional[FilterMode]):
@@ -403,13 +397,13 @@ class DeconstructionPlanner(Blueprintable):
             result = attempt_and_reissue(
                 self,
                 self.Format.DeconstructionPlannerObject.Settings,
-                self._root[self._root_item]["settings"],
+                self._root_obj["settings"],
                 "entity_filter_mode",
                 value,
             )
-            self._root[self._root_item]["settings"]["entity_filter_mode"] = result
+            self._root_obj["settings"]["entity_filter_mode"] = result
         else:
-            self._root[self._root_item]["settings"]["entity_filter_mode"] = value
+            self._root_obj["settings"]["entity_filter_mode"] = value
 
     # =========================================================================
 
@@ -420,7 +414,7 @@ class DeconstructionPlanner(Blueprintable):
         TODO
         TODO: shorthand with list
         """
-        return self._root[self._root_item]["settings"].get("entity_filters", None)
+        return self._root_obj["settings"].get("entity_filters", None)
 
     @entity_filters.setter
     def entity_filters(self, value: Optional[list[EntityFilter]]):
@@ -428,13 +422,13 @@ class DeconstructionPlanner(Blueprintable):
             result = attempt_and_reissue(
                 self,
                 self.Format.DeconstructionPlannerObject.Settings,
-                self._root[self._root_item]["settings"],
+                self._root_obj["settings"],
                 "entity_filters",
                 value,
             )
-            self._root[self._root_item]["settings"]["entity_filters"] = result
+            self._root_obj["settings"]["entity_filters"] = result
         else:
-            self._root[self._root_item]["settings"]["entity_filters"] = value
+            self._root_obj["settings"]["entity_filters"] = value
 
     # =========================================================================
 
@@ -449,7 +443,7 @@ class DeconstructionPlanner(Blueprintable):
 
         :raises TypeError: If set to anything other than a ``bool`` or ``None``.
         """
-        return self._root[self._root_item]["settings"].get("trees_and_rocks_only", None)
+        return self._root_obj["settings"].get("trees_and_rocks_only", None)
 
     @trees_and_rocks_only.setter
     def trees_and_rocks_only(self, value: Optional[bool]):
@@ -457,13 +451,13 @@ class DeconstructionPlanner(Blueprintable):
             result = attempt_and_reissue(
                 self,
                 self.Format.DeconstructionPlannerObject.Settings,
-                self._root[self._root_item]["settings"],
+                self._root_obj["settings"],
                 "trees_and_rocks_only",
                 value,
             )
-            self._root[self._root_item]["settings"]["trees_and_rocks_only"] = result
+            self._root_obj["settings"]["trees_and_rocks_only"] = result
         else:
-            self._root[self._root_item]["settings"]["trees_and_rocks_only"] = value
+            self._root_obj["settings"]["trees_and_rocks_only"] = value
 
     # =========================================================================
 
@@ -479,7 +473,7 @@ class DeconstructionPlanner(Blueprintable):
         :raises ValueError: If not set to an valid :py:data:`.FilterMode` or
             ``None``.
         """
-        return self._root[self._root_item]["settings"].get("tile_filter_mode", None)
+        return self._root_obj["settings"].get("tile_filter_mode", None)
 
     @tile_filter_mode.setter
     def tile_filter_mode(self, value: Optional[FilterMode]):
@@ -487,13 +481,13 @@ class DeconstructionPlanner(Blueprintable):
             result = attempt_and_reissue(
                 self,
                 self.Format.DeconstructionPlannerObject.Settings,
-                self._root[self._root_item]["settings"],
+                self._root_obj["settings"],
                 "tile_filter_mode",
                 value,
             )
-            self._root[self._root_item]["settings"]["tile_filter_mode"] = result
+            self._root_obj["settings"]["tile_filter_mode"] = result
         else:
-            self._root[self._root_item]["settings"]["tile_filter_mode"] = value
+            self._root_obj["settings"]["tile_filter_mode"] = value
 
     # =========================================================================
 
@@ -503,7 +497,7 @@ class DeconstructionPlanner(Blueprintable):
         The list of tile filters.
         TODO
         """
-        return self._root[self._root_item]["settings"].get("tile_filters", None)
+        return self._root_obj["settings"].get("tile_filters", None)
 
     @tile_filters.setter
     def tile_filters(self, value: Optional[list[TileFilter]]):
@@ -511,13 +505,13 @@ class DeconstructionPlanner(Blueprintable):
             result = attempt_and_reissue(
                 self,
                 self.Format.DeconstructionPlannerObject.Settings,
-                self._root[self._root_item]["settings"],
+                self._root_obj["settings"],
                 "tile_filters",
                 value,
             )
-            self._root[self._root_item]["settings"]["tile_filters"] = result
+            self._root_obj["settings"]["tile_filters"] = result
         else:
-            self._root[self._root_item]["settings"]["tile_filters"] = value
+            self._root_obj["settings"]["tile_filters"] = value
 
     # TODO: set_tile_filters() function
 
@@ -539,7 +533,7 @@ class DeconstructionPlanner(Blueprintable):
         :raises ValueError: If not set to a valid :py:data:`.TileSelectionMode`
             or ``None``.
         """
-        return self._root[self._root_item]["settings"].get("tile_selection_mode", None)
+        return self._root_obj["settings"].get("tile_selection_mode", None)
 
     @tile_selection_mode.setter
     def tile_selection_mode(self, value: Optional[TileSelectionMode]):
@@ -547,13 +541,13 @@ class DeconstructionPlanner(Blueprintable):
             result = attempt_and_reissue(
                 self,
                 self.Format.DeconstructionPlannerObject.Settings,
-                self._root[self._root_item]["settings"],
+                self._root_obj["settings"],
                 "tile_selection_mode",
                 value,
             )
-            self._root[self._root_item]["settings"]["tile_selection_mode"] = result
+            self._root_obj["settings"]["tile_selection_mode"] = result
         else:
-            self._root[self._root_item]["settings"]["tile_selection_mode"] = value
+            self._root_obj["settings"]["tile_selection_mode"] = value
 
     # =========================================================================
     # Utility functions
@@ -597,11 +591,11 @@ class DeconstructionPlanner(Blueprintable):
         result = attempt_and_reissue(
             self,
             self.Format.DeconstructionPlannerObject.Settings,
-            self._root[self._root_item]["settings"],
+            self._root_obj["settings"],
             "entity_filters",
             new_filters,
         )
-        self._root[self._root_item]["settings"]["entity_filters"] = result
+        self._root_obj["settings"]["entity_filters"] = result
 
     def set_entity_filters(self, *entity_filters: list[str]):
         """
@@ -617,11 +611,11 @@ class DeconstructionPlanner(Blueprintable):
         result = attempt_and_reissue(
             self,
             self.Format.DeconstructionPlannerObject.Settings,
-            self._root[self._root_item]["settings"],
+            self._root_obj["settings"],
             "entity_filters",
             entity_filters,
         )
-        self._root[self._root_item]["settings"]["entity_filters"] = result
+        self._root_obj["settings"]["entity_filters"] = result
 
     def set_tile_filter(self, index: uint64, name: TileName):
         """
@@ -661,11 +655,11 @@ class DeconstructionPlanner(Blueprintable):
         result = attempt_and_reissue(
             self,
             self.Format.DeconstructionPlannerObject.Settings,
-            self._root[self._root_item]["settings"],
+            self._root_obj["settings"],
             "tile_filters",
             new_filters,
         )
-        self._root[self._root_item]["settings"]["tile_filters"] = result
+        self._root_obj["settings"]["tile_filters"] = result
 
     def set_tile_filters(self, *tile_names: list[str]):
         """
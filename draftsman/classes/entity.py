@@ -9,7 +9,7 @@ from draftsman.classes.exportable import (
     attempt_and_reissue,
 )
 from draftsman.classes.vector import Vector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.data import entities
 from draftsman.error import DraftsmanError, DataFormatError
 from draftsman.signatures import (
@@ -190,12 +190,8 @@ class Entity(Exportable, EntityLike):
         similar_entities: list[str],
         tile_position: IntPosition = (0, 0),
         id: str = None,
-        validate: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate: ValidationSetting = ValidationMode.STRICT,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -695,6 +691,15 @@ class Entity(Exportable, EntityLike):
     def __hash__(self) -> int:
         return id(self) >> 4  # Apparently this is the default?
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Defining `__eq__` in a subclass body sets its `__hash__` to None;
+        # every entity is hashed by identity regardless of its value-equality
+        # semantics, so restore it here rather than restating
+        # `__hash__ = Entity.__hash__` in each prototype
+        if cls.__hash__ is None:
+            cls.__hash__ = Entity.__hash__
+
     def __repr__(self) -> str:  # pragma: no coverage
         # return "<{0}{1}>{2}".format(
         #     type(self).__name__,
@@ -4,7 +4,7 @@ from draftsman.classes.association import Association
 from draftsman.classes.entity_like import EntityLike
 from draftsman.classes.exportable import Exportable, ValidationResult
 from draftsman.classes.spatial_hashmap import SpatialDataStructure, SpatialHashMap
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.entity import new_entity
 from draftsman.error import (
     DataFormatError,
@@ -13,7 +13,7 @@ from draftsman.error import (
     InvalidEntityError,
 )
 from draftsman.utils import reissue_warnings
-from draftsman.signatures import Connections, DraftsmanBaseModel
+from draftsman.signatures import DraftsmanBaseModel
 from draftsman.warning import HiddenEntityWarning
 from draftsman import utils
 
@@ -71,9 +71,7 @@ class EntityList(Exportable, MutableSequence):
         self,
         parent: "EntityCollection" = None,
         initlist: Optional[list[EntityLike]] = [],
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
     ):
         """
         Instantiates a new ``EntityList``.
@@ -93,7 +91,18 @@ class EntityList(Exportable, MutableSequence):
         self.key_to_idx = {}
         self.idx_to_key = {}
 
-        self.spatial_map: SpatialDataStructure = SpatialHashMap()
+        # Constructed lazily on first access; many blueprints (particularly
+        # ones that are just loaded and re-exported) never perform a spatial
+        # query at all
+        self._spatial_map: Optional[SpatialDataStructure] = None
+
+        # Memoized result of `flattened()`, invalidated whenever this list (or
+        # a list nested inside one of its Groups) is mutated
+        self._flattened_cache: Optional[list] = None
+
+        # Memoized result of `double_grid_aligned`, invalidated alongside the
+        # flattened cache; only list membership can change its value
+        self._double_grid_aligned_cache: Optional[bool] = None
 
         self._parent = parent
 
@@ -111,6 +120,44 @@ class EntityList(Exportable, MutableSequence):
 
         self.validate_assignment = validate_assignment
 
+    @property
+    def spatial_map(self) -> SpatialDataStructure:
+        """
+        The spatial map of this list, built lazily from the current entities
+        the first time it's accessed. Read only.
+        """
+        if self._spatial_map is None:
+            self._spatial_map = SpatialHashMap()
+            for entitylike in self._root:
+                self._spatial_map.recursive_add(entitylike, merge=False)
+        return self._spatial_map
+
+    def flattened(self) -> list[EntityLike]:
+        """
+        Returns a 1D list of all the entities in this list, with any nested
+        :py:class:`.Group` structures flattened depth-first. The result is
+        cached across calls and recomputed only after this list (or a list
+        inside one of its groups) is modified.
+
+        :returns: A ``list`` of entities in depth-first sequence.
+        """
+        if self._flattened_cache is None:
+            self._flattened_cache = utils.flatten_entities(self._root)
+        return self._flattened_cache
+
+    @property
+    def double_grid_aligned(self) -> bool:
+        """
+        Whether or not any entity in this list (or in any :py:class:`.Group`
+        nested within it) is double-grid-aligned. Computed once and cached
+        until the list is next modified. Read only.
+        """
+        if self._double_grid_aligned_cache is None:
+            self._double_grid_aligned_cache = any(
+                entity.double_grid_aligned for entity in self._root
+            )
+        return self._double_grid_aligned_cache
+
     @reissue_warnings
     def append(
         self,
@@ -311,16 +358,32 @@ class EntityList(Exportable, MutableSequence):
 
         # If no errors, add this to hashmap (as well as any of it's children),
         # merging as necessary
-        entitylike = self.spatial_map.recursive_add(entitylike, merge)
+        # (If the spatial map hasn't been built yet and we don't need it for
+        # merging, defer its construction until a spatial query actually
+        # happens)
+        if merge or self._spatial_map is not None:
+            entitylike = self.spatial_map.recursive_add(entitylike, merge)
 
-        if entitylike is None:  # input entitylike was entirely merged
-            return  # exit without adding to list
+            if entitylike is None:  # input entitylike was entirely merged
+                return  # exit without adding to list
 
         # Once the parent has itself in order, we can update our data
+        # Normalize `idx` the same way `list.insert` does (negative indices
+        # offset from the end, out-of-range values clamp) so that the key maps
+        # below always store the entity's real, positive index
+        length = len(self._root)
+        if idx < 0:
+            idx = max(0, length + idx)
+        elif idx > length:
+            idx = length
         self._root.insert(idx, entitylike)
-        self._shift_key_indices(idx, 1)
+        self._invalidate_flattened_cache()
+        if idx < len(self._root) - 1:
+            # Only keys at or above `idx` can move; appending (the common case,
+            # including bulk construction) shifts nothing
+            self._shift_key_indices(idx, 1)
         if entitylike.id:
-            self._set_key(entitylike.id, entitylike)
+            self._set_key(entitylike.id, entitylike, idx)
 
         # We make sure the entity we just added points to the correct parent now
         # that it's inserted
@@ -464,10 +527,12 @@ class EntityList(Exportable, MutableSequence):
 
     def clear(self):
         del self._root[:]
+        self._invalidate_flattened_cache()
         self.key_map.clear()
         self.key_to_idx.clear()
         self.idx_to_key.clear()
-        self.spatial_map.clear()
+        if self._spatial_map is not None:
+            self._spatial_map.clear()
 
     def validate(
         self, mode: ValidationMode = ValidationMode.STRICT, force: bool = False
@@ -495,6 +560,7 @@ class EntityList(Exportable, MutableSequence):
             # Reassign private attributes
             # Acquire the newly converted data
             self._root = result["root"]
+            self._invalidate_flattened_cache()
         except ValidationError as e:  # pragma: no coverage
             output.error_list.append(DataFormatError(e))
 
@@ -549,27 +615,30 @@ class EntityList(Exportable, MutableSequence):
         # do this, so it's can-kicking time
         self.check_entitylike(value)
 
-        # Remove the entity and its children
-        self.spatial_map.recursive_remove(self._root[idx])
-
-        # Check for overlapping entities
+        # Remove the entity and its children, check for overlapping entities,
+        # and add the new entity and its children
         # validate = self._parent.validate_assignment
         if self.validate_assignment:
+            # The old entity must leave the (lazily-built) map before checking
+            # the new value for overlaps
+            self.spatial_map.recursive_remove(self._root[idx])
             value.validate(mode=self.validate_assignment).reissue_all()
             self.spatial_map.validate_insert(value, False)
-
-        # Add the new entity and its children
-        self.spatial_map.recursive_add(value, False)
+            self.spatial_map.recursive_add(value, False)
+        elif self._spatial_map is not None:
+            self._spatial_map.recursive_remove(self._root[idx])
+            self._spatial_map.recursive_add(value, False)
 
         # Set the new data association in the list side
         self._root[idx] = value
+        self._invalidate_flattened_cache()
 
         # If the element has a new id, set it to that
         if key:
             self._remove_key(key)
         if value.id:
             # key = getattr(value, "id")
-            self._set_key(value.id, value)
+            self._set_key(value.id, value, idx % len(self._root))
 
         # Add a reference to the parent in the object
         value._parent = self._parent
@@ -583,7 +652,8 @@ class EntityList(Exportable, MutableSequence):
                 idx, key = self.get_pair(i)
 
                 # Remove the entity and its children
-                self.spatial_map.recursive_remove(self._root[idx])
+                if self._spatial_map is not None:
+                    self._spatial_map.recursive_remove(self._root[idx])
 
                 # Remove key pair
                 self._remove_key(key)
@@ -594,6 +664,7 @@ class EntityList(Exportable, MutableSequence):
 
             # Delete all entries in the main list
             del self._root[item]
+            self._invalidate_flattened_cache()
         else:
             # Get pair
             if isinstance(item, int):
@@ -601,10 +672,12 @@ class EntityList(Exportable, MutableSequence):
             idx, key = self.get_pair(item)
 
             # Remove the entity and its children
-            self.spatial_map.recursive_remove(self._root[idx])
+            if self._spatial_map is not None:
+                self._spatial_map.recursive_remove(self._root[idx])
 
             # Delete from list
             del self._root[idx]
+            self._invalidate_flattened_cache()
 
             # Remove key pair
             self._remove_key(key)
@@ -690,47 +763,11 @@ class EntityList(Exportable, MutableSequence):
             new.append(entity_copy, copy=False)
             memo[id(entity)] = entity_copy
 
-        def try_to_replace_association(old):
-            try:
-                return Association(memo[id(old())])
-            except KeyError:
-                # The association must belong outside of the copied region
-                raise InvalidAssociationError(
-                    "Attempting to connect to {} which lies outside this "
-                    "EntityCollection; are all Associations between entities "
-                    "contained within this EntityCollection being copied?".format(
-                        repr(old())
-                    )
-                )
-
-        # Then, we iterate over all the associations in every Entity in the new
-        # EntityList and replace them with associations to the new Entities
-        for entity in new:
-            # swap linked position lmao
-            # entity._position.linked = entity._tile_position
-            # entity._tile_position.linked = entity._position
-            if hasattr(entity, "connections"):
-                connections: Connections = entity.connections
-                for side in connections.true_model_fields():
-                    if connections[side] is None:
-                        continue
-                    if side in {"1", "2"}:
-                        for color, _ in connections[side]:
-                            connection_points = connections[side][color]
-                            if connection_points is None:
-                                continue
-                            for point in connection_points:
-                                old = point["entity_id"]
-                                point["entity_id"] = try_to_replace_association(old)
-                    elif side in {"Cu0", "Cu1"}:  # pragma: no branch
-                        connection_points = connections[side]
-                        for point in connection_points:
-                            old = point["entity_id"]
-                            point["entity_id"] = try_to_replace_association(old)
-            if hasattr(entity, "neighbours"):
-                neighbours = entity.neighbours
-                for i, neighbour in enumerate(neighbours):
-                    neighbours[i] = try_to_replace_association(neighbour)
+        # Associations between copied entities (wires, schedule locomotives)
+        # live on the parent EntityCollection in the 2.0 format, and are
+        # remapped to the new entities by its own __deepcopy__; the 1.0-era
+        # per-entity `connections`/`neighbours` attributes no longer exist, so
+        # there is nothing left to fix up here
 
         return new
 
@@ -749,6 +786,25 @@ class EntityList(Exportable, MutableSequence):
     # Internal functions
     # =========================================================================
 
+    def _invalidate_flattened_cache(self):
+        """
+        Discards the memoized :py:meth:`flattened` and
+        :py:attr:`double_grid_aligned` results of this list, as well as those
+        of any ancestor ``EntityList`` whose contents include this list's
+        (when this list belongs to a :py:class:`.Group` placed inside another
+        collection).
+        """
+        self._flattened_cache = None
+        self._double_grid_aligned_cache = None
+        parent = self._parent
+        while parent is not None:
+            grandparent = getattr(parent, "parent", None)
+            entities = getattr(grandparent, "entities", None)
+            if isinstance(entities, EntityList):
+                entities._flattened_cache = None
+                entities._double_grid_aligned_cache = None
+            parent = grandparent
+
     def _remove_key(self, key: str):
         """
         Shorthand to remove ``key`` from the key mapping dictionaries. Does
@@ -765,13 +821,16 @@ class EntityList(Exportable, MutableSequence):
             del self.key_to_idx[key]
             del self.idx_to_key[idx]
 
-    def _set_key(self, key: str, value: "EntityLike"):
+    def _set_key(self, key: str, value: "EntityLike", idx: Optional[int] = None):
         """
         Shorthand to set ``key`` in the key mapping dictionaries to point to
         ``value``.
 
         :param key: A ``str`` to associate with ``value``.
         :param value: An ``EntityLike`` instance to associate with ``key``.
+        :param idx: The index of ``value`` within the list, if already known by
+            the caller; otherwise it's searched for, which is both slower and
+            ambiguous when the list contains value-equal duplicates.
 
         :exception DuplicateIDError: If ``key`` already exists within the
             ``EntityList``.
@@ -780,7 +839,8 @@ class EntityList(Exportable, MutableSequence):
         """
         if key in self.key_map:
             raise DuplicateIDError("'{}'".format(key))
-        idx = self._root.index(value)
+        if idx is None:
+            idx = self._root.index(value)
         self.key_map[key] = value
         self.key_to_idx[key] = idx
         self.idx_to_key[idx] = key
@@ -791,6 +851,9 @@ class EntityList(Exportable, MutableSequence):
         Used when inserting or removing elements before the end, which moves
         what index each key should point to.
         """
+        # Nothing to rebuild if no entities are keyed
+        if not self.key_to_idx:
+            return
 
         # Shift the indices for key_to_idx
         self.key_to_idx = {
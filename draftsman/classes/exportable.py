@@ -1,6 +1,6 @@
 # exportable.py
 from draftsman import __factorio_version_info__
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 
 from draftsman.error import DataFormatError
 
@@ -15,7 +15,14 @@ def attempt_and_reissue(
     object: Any, format_model: Any, target: Any, name: str, value: Any, **kwargs
 ):
     """
-    Helper function that normalizes assignment validation
+    Helper function that normalizes assignment validation.
+
+    Setters are expected to branch on ``self.validate_assignment`` *before*
+    calling this function and write the raw value directly when assignment
+    validation is disabled; that keeps disabled-mode attribute writes O(1).
+    This function cannot short-circuit on ``ValidationMode.NONE`` itself,
+    since some callers (e.g. :py:meth:`.InventoryFilterMixin.set_inventory_filters`)
+    rely on structural errors being raised even in that mode.
     """
     context = {
         "mode": object.validate_assignment,
@@ -237,7 +244,7 @@ class Exportable(metaclass=ABCMeta):
     @property
     def validate_assignment(
         self,
-    ) -> Union[ValidationMode, Literal["none", "minimum", "strict", "pedantic"]]:
+    ) -> ValidationSetting:
         """
         Toggleable flag that indicates whether assignments to this object should
         be validated, and how. Can be set in the constructor of the entity or
@@ -315,6 +322,12 @@ class Exportable(metaclass=ABCMeta):
         pass  # pragma: no coverage
 
     def to_dict(self, exclude_none: bool = True, exclude_defaults: bool = True) -> dict:
+        """
+        Returns a JSON-serializable dict representation of this object. The
+        returned dict (and every container nested inside of it) is freshly
+        constructed and owned by the caller; mutating it never affects this
+        object, so no defensive copy is required afterwards.
+        """
         return self._root.model_dump(
             # Some attributes are reserved words ('type', 'from', etc.); this
             # resolves that issue
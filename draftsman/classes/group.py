@@ -9,6 +9,7 @@ from draftsman.classes.collision_set import CollisionSet
 from draftsman.classes.entity_like import EntityLike
 from draftsman.classes.entity_list import EntityList
 from draftsman.classes.exportable import ValidationMode, ValidationResult
+from draftsman.constants import ValidationSetting
 from draftsman.classes.schedule import Schedule
 from draftsman.classes.schedule_list import ScheduleList
 from draftsman.classes.transformable import Transformable
@@ -21,7 +22,7 @@ from draftsman.signatures import Connections
 from draftsman.utils import (
     AABB,
     aabb_to_dimensions,
-    extend_aabb,
+    aabb_union,
     flatten_entities,
     reissue_warnings,
     string_to_JSON,
@@ -90,9 +91,7 @@ class Group(Transformable, EntityCollection, EntityLike):
         schedules: Union[list[Schedule], ScheduleList] = [],
         wires: Optional[list[list[int]]] = None,
         string: str = None,
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
     ):
         """
         :param string: A blueprint string to use as the basis for this Group;
@@ -424,10 +423,7 @@ class Group(Transformable, EntityCollection, EntityLike):
 
     @property
     def double_grid_aligned(self) -> bool:
-        for entity in self.entities:
-            if entity.double_grid_aligned:
-                return True
-        return False
+        return self.entities.double_grid_aligned
 
     # =========================================================================
 
@@ -530,11 +526,9 @@ class Group(Transformable, EntityCollection, EntityLike):
         """
         TODO
         """
-        area = None
-        for entity in self.entities:
-            area = extend_aabb(area, entity.get_world_bounding_box())
-
-        return area
+        return aabb_union(
+            entity.get_world_bounding_box() for entity in self.entities
+        )
 
     def get_dimensions(self) -> tuple[int, int]:
         """
@@ -105,7 +105,6 @@ class ControlBehaviorMixin:
 
     # =========================================================================
 
-    @validate_call
     def _set_condition(
         self,
         condition_name: str,
@@ -128,21 +127,15 @@ class ControlBehaviorMixin:
             ``cmp`` is not a valid operation, or if ``b`` is neither a valid
             signal name nor a constant.
         """
-        new_condition = Condition()
-
-        # A
-        # if a is None:
-        #     condition.pop("first_signal", None)
-        # else:
-        #     condition["first_signal"] = a
-        new_condition.first_signal = a
-        new_condition.comparator = cmp
-
+        # Assemble the condition in one shot without validation; the
+        # `attempt_and_reissue` below revalidates the whole instance anyway
+        fields = {"first_signal": a, "comparator": cmp}
         # B (should never be None)
         if isinstance(b, int):
-            new_condition.constant = b
+            fields["constant"] = b
         else:
-            new_condition.second_signal = b
+            fields["second_signal"] = b
+        new_condition = Condition.model_construct(**fields)
 
         # TODO: we need to figure out a way to dirty an entity even if we only
         # modify it's sub-attributes like control behavior; the above function
@@ -166,4 +159,6 @@ class ControlBehaviorMixin:
     # =========================================================================
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         return super().__eq__(other) and self.control_behavior == other.control_behavior
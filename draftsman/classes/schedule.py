@@ -9,6 +9,7 @@ from draftsman.classes.exportable import (
 from draftsman.constants import (
     Ticks,
     ValidationMode,
+    ValidationSetting,
     WaitConditionType,
     WaitConditionCompareType,
 )
@@ -117,12 +118,8 @@ class WaitCondition(Exportable):
         compare_type: Literal["and", "or"] = "or",
         ticks: Optional[uint32] = None,
         condition: Condition = None,
-        validate: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate: ValidationSetting = ValidationMode.STRICT,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
     ):
         """
         Constructs a new :py:class:`WaitCondition` object.
@@ -467,9 +464,7 @@ class Schedule(Exportable):
         self,
         locomotives: list[Association] = [],
         schedule: Format.ScheduleSpecification = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
     ):
         """
         TODO
@@ -17,7 +17,7 @@ from draftsman.classes.exportable import (
 )
 from draftsman.classes.spatial_like import SpatialLike
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.error import DataFormatError, DraftsmanError, InvalidTileError
 from draftsman.signatures import (
     DraftsmanBaseModel,
@@ -105,9 +105,7 @@ class Tile(SpatialLike, Exportable):
         self,
         name: str,
         position=(0, 0),
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs,
     ):
         """
@@ -2,7 +2,7 @@
 
 from draftsman.classes.spatial_hashmap import SpatialDataStructure, SpatialHashMap
 from draftsman.classes.exportable import Exportable, ValidationResult
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.tile import Tile, new_tile
 from draftsman.data import tiles
 from draftsman.error import DataFormatError, InvalidTileError
@@ -42,9 +42,7 @@ class TileList(Exportable, MutableSequence):
         self,
         parent: "TileCollection",
         initlist: Optional[list[Tile]] = None,
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
     ) -> None:
         """
         TODO
@@ -54,7 +52,8 @@ class TileList(Exportable, MutableSequence):
 
         self._root = []
 
-        self.spatial_map: SpatialDataStructure = SpatialHashMap()
+        # Constructed lazily on first access, same as `EntityList`
+        self._spatial_map: Optional[SpatialDataStructure] = None
 
         self._parent = parent
 
@@ -72,6 +71,18 @@ class TileList(Exportable, MutableSequence):
 
         self.validate_assignment = validate_assignment
 
+    @property
+    def spatial_map(self) -> SpatialDataStructure:
+        """
+        The spatial map of this list, built lazily from the current tiles the
+        first time it's accessed. Read only.
+        """
+        if self._spatial_map is None:
+            self._spatial_map = SpatialHashMap()
+            for tile in self._root:
+                self._spatial_map.add(tile, merge=False)
+        return self._spatial_map
+
     def append(
         self, name: Union[str, Tile], copy: bool = True, merge: bool = False, **kwargs
     ) -> None:
@@ -130,11 +141,13 @@ class TileList(Exportable, MutableSequence):
             tile.validate(mode=self.validate_assignment).reissue_all()
             self.spatial_map.validate_insert(tile, merge=merge)
 
-        # Add to tile map
-        tile = self.spatial_map.add(tile, merge=merge)
+        # Add to tile map, unless it hasn't been built yet and isn't needed
+        # for merging
+        if merge or self._spatial_map is not None:
+            tile = self.spatial_map.add(tile, merge=merge)
 
-        if tile is None:  # Tile was merged
-            return  # Don't add this tile to the list
+            if tile is None:  # Tile was merged
+                return  # Don't add this tile to the list
 
         # Manage TileList
         self._root.insert(idx, tile)
@@ -144,7 +157,8 @@ class TileList(Exportable, MutableSequence):
 
     def clear(self) -> None:
         del self._root[:]
-        self.spatial_map.clear()
+        if self._spatial_map is not None:
+            self._spatial_map.clear()
 
     def validate(
         self, mode: ValidationMode = ValidationMode.STRICT, force: bool = False
@@ -249,13 +263,16 @@ class TileList(Exportable, MutableSequence):
         if not isinstance(value, Tile):
             raise TypeError("Entry in TileList must be a Tile")
 
-        self.spatial_map.remove(self._root[idx])
-
         if self.validate_assignment:
+            # The old tile must leave the (lazily-built) map before checking
+            # the new value for overlaps
+            self.spatial_map.remove(self._root[idx])
             value.validate(mode=self.validate_assignment).reissue_all()
             self.spatial_map.validate_insert(value, merge=False)
-
-        self.spatial_map.add(value, merge=False)
+            self.spatial_map.add(value, merge=False)
+        elif self._spatial_map is not None:
+            self._spatial_map.remove(self._root[idx])
+            self._spatial_map.add(value, merge=False)
 
         # Manage the TileList
         self._root[idx] = value
@@ -264,14 +281,15 @@ class TileList(Exportable, MutableSequence):
         value._parent = self._parent
 
     def __delitem__(self, idx: Union[int, slice]) -> None:
-        if isinstance(idx, slice):
-            # Get slice parameters
-            start, stop, step = idx.indices(len(self))
-            for i in range(start, stop, step):
-                # Remove from parent
-                self.spatial_map.remove(self._root[i])
-        else:
-            self.spatial_map.remove(self._root[idx])
+        if self._spatial_map is not None:
+            if isinstance(idx, slice):
+                # Get slice parameters
+                start, stop, step = idx.indices(len(self))
+                for i in range(start, stop, step):
+                    # Remove from parent
+                    self._spatial_map.remove(self._root[i])
+            else:
+                self._spatial_map.remove(self._root[idx])
 
         # Remove from self
         del self._root[idx]
@@ -14,7 +14,7 @@ from draftsman.classes.exportable import (
     attempt_and_reissue,
     test_replace_me,
 )
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.data import entities, items
 from draftsman.error import DataFormatError
 from draftsman.signatures import (
@@ -409,12 +409,8 @@ class UpgradePlanner(Blueprintable):
         self,
         upgrade_planner: Union[str, dict, None] = None,
         index: Optional[uint16] = None,
-        validate: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate: ValidationSetting = ValidationMode.STRICT,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
     ):
         """
         Constructs a new :py:class:`.UpgradePlanner`.
@@ -451,9 +447,7 @@ class UpgradePlanner(Blueprintable):
         version: uint64 = __factorio_version_info__,
         settings: Format.UpgradePlannerObject.Settings = {},
         index: Optional[uint16] = None,
-        validate: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         kwargs.pop("item", None)
@@ -464,7 +458,7 @@ class UpgradePlanner(Blueprintable):
         test_replace_me(
             self,
             self.Format.UpgradePlannerObject,
-            self._root[self._root_item],
+            self._root_obj,
             "settings",
             settings,
             self.validate_assignment,
@@ -492,14 +486,14 @@ class UpgradePlanner(Blueprintable):
 
     @property
     def description(self) -> Optional[str]:
-        return self._root[self._root_item]["settings"].get("description", None)
+        return self._root_obj["settings"].get("description", None)
 
     @description.setter
     def description(self, value: Optional[str]):
         test_replace_me(
             self,
             self.Format.UpgradePlannerObject.Settings,
-            self._root[self._root_item]["settings"],
+            self._root_obj["settings"],
             "description",
             value,
             self.validate_assignment,
@@ -520,14 +514,14 @@ class UpgradePlanner(Blueprintable):
 
     @property
     def icons(self) -> Optional[list[Icon]]:
-        return self._root[self._root_item]["settings"].get("icons", None)
+        return self._root_obj["settings"].get("icons", None)
 
     @icons.setter
     def icons(self, value: Union[list[str], list[Icon], None]):
         test_replace_me(
             self,
             self.Format.UpgradePlannerObject.Settings,
-            self._root[self._root_item]["settings"],
+            self._root_obj["settings"],
             "icons",
             value,
             self.validate_assignment,
@@ -569,14 +563,14 @@ class UpgradePlanner(Blueprintable):
         :setter: Sets the mappers dictionary, or deletes the dictionary if set
             to ``None``
         """
-        return self._root[self._root_item]["settings"].get("mappers", None)
+        return self._root_obj["settings"].get("mappers", None)
 
     @mappers.setter
     def mappers(self, value: Optional[list[Union[tuple[str, str], Mapper]]]):
         test_replace_me(
             self,
             self.Format.UpgradePlannerObject.Settings,
-            self._root[self._root_item]["settings"],
+            self._root_obj["settings"],
             "mappers",
             value,
             self.validate_assignment,
@@ -16,6 +16,10 @@ class Vector(object):
     A simple 2d vector class, used to aid in developent and user experience.
     """
 
+    # One Vector exists per entity position (plus linked tile positions), so
+    # skipping the per-instance `__dict__` saves real memory on big blueprints
+    __slots__ = ("_data",)
+
     def __init__(self, x: Union[float, int], y: Union[float, int]):
         """
         Constructs a new :py:class:`.Vector`.
@@ -26,6 +30,14 @@ class Vector(object):
         self._data = [0, 0]
         self.update(x, y)
 
+    def __getstate__(self) -> dict:
+        return {"_data": self._data}
+
+    def __setstate__(self, state) -> None:
+        # Also accommodates pickles created before `__slots__` was added,
+        # where the state is the instance `__dict__` (same shape)
+        self._data = state["_data"]
+
     @property
     def x(self) -> Union[float, int]:
         """
@@ -10,6 +10,7 @@ from datetime import timedelta
 from enum import IntEnum, Enum
 from functools import total_ordering
 import math
+from typing import Literal, Union
 from pydantic_core import core_schema
 
 
@@ -847,3 +848,11 @@ class ValidationMode(Enum):
                 other.name
             )
         return NotImplemented
+
+
+ValidationSetting = Union[ValidationMode, Literal["none", "minimum", "strict", "pedantic"]]
+"""
+Alias for the set of values accepted anywhere a :py:class:`.ValidationMode`
+parameter is expected; either a member of the enum itself or its string
+shorthand.
+"""
@@ -123,10 +123,11 @@ def signal_dict(signal: str) -> dict:
     if signal is None or isinstance(signal, dict):
         return signal
     else:
-        if "item" in get_signal_types(signal):
+        signal_types = get_signal_types(signal)
+        if "item" in signal_types:
             return {"name": str(signal), "type": "item"}
         else:
-            return {"name": str(signal), "type": next(iter(get_signal_types(signal)))}
+            return {"name": str(signal), "type": next(iter(signal_types))}
 
 
 def get_mapper_type(mapper_name: str) -> str:
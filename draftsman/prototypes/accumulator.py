@@ -5,7 +5,7 @@ from draftsman.classes.entity import Entity
 from draftsman.classes.exportable import attempt_and_reissue
 from draftsman.classes.mixins import ControlBehaviorMixin, CircuitConnectableMixin
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.signatures import Connections, DraftsmanBaseModel, SignalID
 from draftsman.utils import get_first
 
@@ -43,11 +43,9 @@ class Accumulator(ControlBehaviorMixin, CircuitConnectableMixin, Entity):
         name: Optional[str] = get_first(accumulators),
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
-        control_behavior: Format.ControlBehavior = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -61,8 +59,8 @@ class Accumulator(ControlBehaviorMixin, CircuitConnectableMixin, Entity):
             accumulators,
             position=position,
             tile_position=tile_position,
-            control_behavior=control_behavior,
-            tags=tags,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -101,7 +99,5 @@ class Accumulator(ControlBehaviorMixin, CircuitConnectableMixin, Entity):
 
     # =========================================================================
 
-    __hash__ = Entity.__hash__
-
     def __eq__(self, other: "Accumulator") -> bool:
         return super().__eq__(other) and self.output_signal == other.output_signal
@@ -8,7 +8,7 @@ from draftsman.classes.mixins import (
     ControlBehaviorMixin,
     CircuitConnectableMixin,
 )
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.signatures import DraftsmanBaseModel, uint8, uint32
 from draftsman.utils import Vector, PrimitiveVector, get_first
 
@@ -60,12 +60,10 @@ class AgriculturalTower(
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         direction: Direction = Direction.NORTH,
         override_stack_size: uint8 = None,
-        control_behavior: Format.ControlBehavior = {},
-        items: dict[str, uint32] = {},  # TODO: ItemID
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        items: Optional[dict[str, uint32]] = None,  # TODO: ItemID
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         super().__init__(
@@ -75,9 +73,9 @@ class AgriculturalTower(
             tile_position=tile_position,
             direction=direction,
             override_stack_size=override_stack_size,
-            control_behavior=control_behavior,
-            items=items,
-            tags=tags,
+            control_behavior={} if control_behavior is None else control_behavior,
+            items={} if items is None else items,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -114,5 +112,3 @@ class AgriculturalTower(
             self.control_behavior.read_contents = value
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
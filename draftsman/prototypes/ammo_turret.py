@@ -13,7 +13,7 @@ from draftsman.classes.mixins import (
     DirectionalMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.signatures import DraftsmanBaseModel, ItemRequest
 from draftsman.utils import get_first
 
@@ -72,11 +72,9 @@ class AmmoTurret(
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         direction: Direction = Direction.NORTH,
-        items: Optional[list[ItemRequest]] = [],  # TODO: ItemID
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        items: Optional[list[ItemRequest]] = None,  # TODO: ItemID
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -91,13 +89,11 @@ class AmmoTurret(
             position=position,
             tile_position=tile_position,
             direction=direction,
-            items=items,
-            tags=tags,
+            items=[] if items is None else items,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
         self.validate_assignment = validate_assignment
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
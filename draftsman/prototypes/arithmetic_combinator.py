@@ -9,7 +9,7 @@ from draftsman.classes.mixins import (
     DirectionalMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.signatures import (
     DraftsmanBaseModel,
     NetworkSpecification,
@@ -226,11 +226,9 @@ class ArithmeticCombinator(
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         direction: Optional[Direction] = Direction.NORTH,
         player_description: Optional[str] = None,
-        control_behavior: Format.ControlBehavior = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -246,8 +244,8 @@ class ArithmeticCombinator(
             tile_position=tile_position,
             direction=direction,
             player_description=player_description,
-            control_behavior=control_behavior,
-            tags=tags,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -573,5 +571,3 @@ class ArithmeticCombinator(
         )
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
@@ -14,7 +14,7 @@ from draftsman.classes.mixins import (
     DirectionalMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.signatures import Connections, DraftsmanBaseModel, uint8
 from draftsman.utils import get_first
 
@@ -75,11 +75,9 @@ class ArtilleryTurret(
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         direction: Direction = Direction.NORTH,
         artillery_auto_targeting: Optional[bool] = True,
-        control_behavior: Format.ControlBehavior = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         self._root: self.__class__.Format
@@ -90,13 +88,11 @@ class ArtilleryTurret(
             tile_position=tile_position,
             direction=direction,
             artillery_auto_targeting=artillery_auto_targeting,
-            control_behavior=control_behavior,
-            tags=tags,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
         self.validate_assignment = validate_assignment
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
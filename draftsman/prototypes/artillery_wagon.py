@@ -8,7 +8,7 @@ from draftsman.classes.mixins import (
     OrientationMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Orientation, ValidationMode
+from draftsman.constants import Orientation, ValidationMode, ValidationSetting
 from draftsman.signatures import ItemRequest
 from draftsman.utils import get_first
 
@@ -45,13 +45,11 @@ class ArtilleryWagon(
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         orientation: Orientation = Orientation.NORTH,
         enable_logistics_while_moving: Optional[bool] = False,
-        grid: list[Format.EquipmentComponent] = [],
+        grid: Optional[list[Format.EquipmentComponent]] = None,
         artillery_auto_targeting: Optional[bool] = True,
-        items: Optional[list[ItemRequest]] = [],  # TODO: ItemID
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        items: Optional[list[ItemRequest]] = None,  # TODO: ItemID
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -65,10 +63,10 @@ class ArtilleryWagon(
             tile_position=tile_position,
             orientation=orientation,
             enable_logistics_while_moving=enable_logistics_while_moving,
-            grid=grid,
+            grid=[] if grid is None else grid,
             artillery_auto_targeting=artillery_auto_targeting,
-            items=items,
-            tags=tags,
+            items=[] if items is None else items,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -79,5 +77,3 @@ class ArtilleryWagon(
     # Though what about mods?
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
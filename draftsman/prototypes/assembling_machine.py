@@ -10,7 +10,7 @@ from draftsman.classes.mixins import (
     DirectionalMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.signatures import ItemRequest, uint32
 from draftsman.utils import get_first
 from draftsman.warning import ModuleLimitationWarning
@@ -90,11 +90,9 @@ class AssemblingMachine(
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         direction: Direction = Direction.NORTH,
         recipe: str = None,
-        items: Optional[list[ItemRequest]] = [],
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        items: Optional[list[ItemRequest]] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -108,8 +106,8 @@ class AssemblingMachine(
             tile_position=tile_position,
             direction=direction,
             recipe=recipe,
-            items=items,
-            tags=tags,
+            items=[] if items is None else items,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -181,5 +179,3 @@ class AssemblingMachine(
             return modules.get_modules_from_effects(self.allowed_effects, self.recipe)
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
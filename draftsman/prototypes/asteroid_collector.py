@@ -11,7 +11,7 @@ from draftsman.classes.mixins import (
     DirectionalMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode, Direction
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.signatures import DraftsmanBaseModel, ChunkID
 from draftsman.utils import get_first
 
@@ -97,12 +97,10 @@ class AsteroidCollector(
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         direction: Direction = Direction.NORTH,
         result_inventory=None,
-        chunk_filter: list[ChunkID] = [],
-        control_behavior: Format.ControlBehavior = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        chunk_filter: Optional[list[ChunkID]] = None,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -117,13 +115,13 @@ class AsteroidCollector(
             position=position,
             tile_position=tile_position,
             direction=direction,
-            control_behavior=control_behavior,
-            tags=tags,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
         # self.result_inventory = result_inventory
-        self.chunk_filter = chunk_filter
+        self.chunk_filter = [] if chunk_filter is None else chunk_filter
 
         self.validate_assignment = validate_assignment
 
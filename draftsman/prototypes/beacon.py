@@ -7,7 +7,7 @@ from draftsman.classes.mixins import (
     RequestItemsMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.signatures import ItemRequest
 from draftsman.utils import get_first
 
@@ -34,11 +34,9 @@ class Beacon(ModulesMixin, RequestItemsMixin, Entity):
         name: Optional[str] = get_first(beacons),
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
-        items: list[ItemRequest] = [],
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        items: Optional[list[ItemRequest]] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -50,8 +48,8 @@ class Beacon(ModulesMixin, RequestItemsMixin, Entity):
             beacons,
             position=position,
             tile_position=tile_position,
-            items=items,
-            tags=tags,
+            items=[] if items is None else items,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -69,5 +67,3 @@ class Beacon(ModulesMixin, RequestItemsMixin, Entity):
     #     return set()
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
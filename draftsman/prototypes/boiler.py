@@ -3,7 +3,7 @@
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import RequestItemsMixin, DirectionalMixin
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.signatures import ItemRequest
 from draftsman.utils import get_first
 from draftsman.warning import DraftsmanWarning
@@ -29,11 +29,9 @@ class Boiler(RequestItemsMixin, DirectionalMixin, Entity):
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         direction: Direction = Direction.NORTH,
-        items: Optional[list[ItemRequest]] = [],  # TODO: ItemID
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        items: Optional[list[ItemRequest]] = None,  # TODO: ItemID
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -46,8 +44,8 @@ class Boiler(RequestItemsMixin, DirectionalMixin, Entity):
             position=position,
             tile_position=tile_position,
             direction=direction,
-            items=items,
-            tags=tags,
+            items=[] if items is None else items,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -56,5 +54,3 @@ class Boiler(RequestItemsMixin, DirectionalMixin, Entity):
     # TODO: ensure fuel requests to this entity match it's allowed fuel categories
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
@@ -7,7 +7,7 @@ from draftsman.classes.mixins import (
     DirectionalMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.signatures import ItemRequest, uint32
 from draftsman.utils import get_first
 from draftsman.warning import ItemLimitationWarning
@@ -72,11 +72,9 @@ class BurnerGenerator(
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         direction: Direction = Direction.NORTH,
-        items: Optional[list[ItemRequest]] = [],  # TODO: ItemID
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        items: Optional[list[ItemRequest]] = None,  # TODO: ItemID
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -89,8 +87,8 @@ class BurnerGenerator(
             position=position,
             tile_position=tile_position,
             direction=direction,
-            items=items,
-            tags=tags,
+            items=[] if items is None else items,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -103,5 +101,3 @@ class BurnerGenerator(
         return entities.raw.get(self.name, {"burner": None})["burner"]
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
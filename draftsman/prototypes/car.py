@@ -9,7 +9,7 @@ from draftsman.classes.mixins import (
     OrientationMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector, PrimitiveIntVector
-from draftsman.constants import Orientation, ValidationMode
+from draftsman.constants import Orientation, ValidationMode, ValidationSetting
 from draftsman.signatures import uint32
 from draftsman.utils import get_first
 
@@ -42,16 +42,14 @@ class Car(
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         orientation: Optional[Orientation] = Orientation.NORTH,
         enable_logistics_while_moving: Optional[bool] = True,
-        grid: list[Format.EquipmentComponent] = [],
+        grid: Optional[list[Format.EquipmentComponent]] = None,
         trunk_inventory=None,
         ammo_inventory=None,
         driver_is_main_gunner: Optional[bool] = True,
         selected_gun_index: Optional[uint32] = 1,  # TODO: size
-        items: dict[str, uint32] = {},  # TODO: ItemID
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        items: Optional[dict[str, uint32]] = None,  # TODO: ItemID
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -64,18 +62,16 @@ class Car(
             tile_position=tile_position,
             orientation=orientation,
             enable_logistics_while_moving=enable_logistics_while_moving,
-            grid=grid,
+            grid=[] if grid is None else grid,
             trunk_inventory=trunk_inventory,
             ammo_inventory=ammo_inventory,
             driver_is_main_gunner=driver_is_main_gunner,
             selected_gun_index=selected_gun_index,
-            items=items,
-            tags=tags,
+            items={} if items is None else items,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
         self.validate_assignment = validate_assignment
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
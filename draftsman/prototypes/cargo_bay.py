@@ -3,7 +3,7 @@
 from draftsman.classes.entity import Entity
 
 # from draftsman.classes.mixins import ()
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.classes.vector import Vector, PrimitiveVector
 from draftsman.utils import get_first
 
@@ -30,10 +30,8 @@ class CargoBay:
         name: Optional[str] = get_first(cargo_bays),
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -45,12 +43,10 @@ class CargoBay:
             similar_entities=cargo_bays,
             position=position,
             tile_position=tile_position,
-            tags=tags,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
         self.validate_assignment = validate_assignment
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
@@ -8,7 +8,7 @@ from draftsman.classes.mixins import (
     CircuitConnectableMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.signatures import DraftsmanBaseModel
 from draftsman.utils import get_first
 
@@ -50,11 +50,9 @@ class CargoLandingPad(
         name: Optional[str] = get_first(cargo_landing_pads),
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
-        control_behavior: Optional[Format.ControlBehavior] = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -66,13 +64,11 @@ class CargoLandingPad(
             similar_entities=cargo_landing_pads,
             position=position,
             tile_position=tile_position,
-            control_behavior=control_behavior,
-            tags=tags,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
         self.validate_assignment = validate_assignment
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
@@ -8,7 +8,7 @@ from draftsman.classes.mixins import (
     OrientationMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Orientation, ValidationMode
+from draftsman.constants import Orientation, ValidationMode, ValidationSetting
 from draftsman.signatures import ItemRequest
 from draftsman.utils import get_first
 
@@ -45,13 +45,11 @@ class CargoWagon(
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         orientation: Orientation = Orientation.NORTH,
         enable_logistics_while_moving: Optional[bool] = True,
-        grid: list[Format.EquipmentComponent] = [],
-        items: Optional[list[ItemRequest]] = [],  # TODO: ItemID
-        inventory: Format.InventoryFilters = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        grid: Optional[list[Format.EquipmentComponent]] = None,
+        items: Optional[list[ItemRequest]] = None,  # TODO: ItemID
+        inventory: Optional[Format.InventoryFilters] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         super().__init__(
@@ -61,10 +59,10 @@ class CargoWagon(
             tile_position=tile_position,
             orientation=orientation,
             enable_logistics_while_moving=enable_logistics_while_moving,
-            grid=grid,
-            items=items,
-            inventory=inventory,
-            tags=tags,
+            grid=[] if grid is None else grid,
+            items=[] if items is None else items,
+            inventory={} if inventory is None else inventory,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -73,5 +71,3 @@ class CargoWagon(
     # TODO: check for item requests exceeding cargo capacity
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
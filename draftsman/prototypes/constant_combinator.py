@@ -9,7 +9,7 @@ from draftsman.classes.mixins import (
     DirectionalMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.data.signals import get_signal_types
 from draftsman.error import DataFormatError
 from draftsman.signatures import (
@@ -125,7 +125,7 @@ class ConstantCombinator(
                         existing_index = None
                         for i, signal_filter in enumerate(new_filters):
                             if (
-                                index + 1 == signal_filter["index"]
+                                index + 1 == signal_filter.index
                             ):  # Index already exists in the list
                                 if name is None:  # Delete the entry
                                     del new_filters[i]
@@ -147,15 +147,12 @@ class ConstantCombinator(
                         :returns: A ``dict`` that conforms to :py:data:`.SIGNAL_FILTER`, or
                             ``None`` if nothing was found at that index.
                         """
-                        if not self.filters:
+                        filters = self.filters
+                        if not filters:
                             return None
 
                         return next(
-                            (
-                                item
-                                for item in self.filters
-                                if item["index"] == index + 1
-                            ),
+                            (item for item in filters if item.index == index + 1),
                             None,
                         )
 
@@ -216,9 +213,7 @@ class ConstantCombinator(
         connections: Optional[Connections] = None,
         control_behavior: Optional[Format.ControlBehavior] = None,
         tags: Optional[dict[str, Any]] = None,
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -450,5 +445,3 @@ class ConstantCombinator(
     #     return next((item for item in filters if item["index"] == index + 1), None)
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
@@ -9,7 +9,7 @@ from draftsman.classes.mixins import (
     DirectionalMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.error import DataFormatError, DraftsmanError
 from draftsman.signatures import (
     Condition,
@@ -471,10 +471,8 @@ class DeciderCombinator(
         direction: Optional[Direction] = Direction.NORTH,
         player_description: Optional[str] = None,
         control_behavior: Optional[Format.ControlBehavior] = None,
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -491,7 +489,7 @@ class DeciderCombinator(
             direction=direction,
             player_description=player_description,
             control_behavior={} if control_behavior is None else control_behavior,
-            tags=tags,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -829,5 +827,3 @@ class DeciderCombinator(
         )
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
@@ -8,7 +8,7 @@ from draftsman.classes.mixins import (
     DirectionalMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.signatures import Condition, DraftsmanBaseModel, SignalID
 from draftsman.utils import get_first
 
@@ -73,11 +73,9 @@ class DisplayPanel(
         icon: Optional[SignalID] = None,
         always_show: Optional[bool] = False,
         show_in_chart: Optional[bool] = False,
-        control_behavior: Optional[Format.ControlBehavior] = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -90,8 +88,8 @@ class DisplayPanel(
             position=position,
             tile_position=tile_position,
             direction=direction,
-            control_behavior=control_behavior,
-            tags=tags,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -175,5 +173,3 @@ class DisplayPanel(
         pass  # TODO
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
@@ -8,7 +8,7 @@
 from draftsman.classes.entity import Entity
 from draftsman.classes.exportable import attempt_and_reissue
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.utils import get_first, parse_energy
 
 from draftsman.data.entities import electric_energy_interfaces
@@ -58,10 +58,8 @@ class ElectricEnergyInterface(Entity):
         buffer_size: float = None,
         power_production: float = None,
         power_usage: float = None,
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -75,7 +73,7 @@ class ElectricEnergyInterface(Entity):
             electric_energy_interfaces,
             position=position,
             tile_position=tile_position,
-            tags=tags,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -240,8 +238,6 @@ class ElectricEnergyInterface(Entity):
 
     # =========================================================================
 
-    __hash__ = Entity.__hash__
-
     def __eq__(self, other) -> bool:
         return (
             super().__eq__(other)
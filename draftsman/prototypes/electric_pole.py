@@ -3,7 +3,7 @@
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import CircuitConnectableMixin, PowerConnectableMixin
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.data import entities
 from draftsman.signatures import Connections, uint64
 from draftsman.utils import get_first
@@ -30,9 +30,7 @@ class ElectricPole(CircuitConnectableMixin, PowerConnectableMixin, Entity):
         position: Union[Vector, PrimitiveVector, None] = None,
         tile_position: Union[Vector, PrimitiveVector, None] = (0, 0),
         tags: Optional[dict[str, Any]] = None,
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -60,5 +58,3 @@ class ElectricPole(CircuitConnectableMixin, PowerConnectableMixin, Entity):
         )
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
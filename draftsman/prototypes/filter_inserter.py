@@ -16,7 +16,7 @@ from draftsman.classes.mixins import (
     DirectionalMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.data.entities import of_type
 from draftsman.signatures import Connections, DraftsmanBaseModel, FilterEntry, uint8
 from draftsman.utils import get_first
@@ -111,14 +111,12 @@ class FilterInserter(
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         direction: Direction = Direction.NORTH,
         override_stack_size: uint8 = None,
-        filters: list[FilterEntry] = [],
+        filters: Optional[list[FilterEntry]] = None,
         filter_mode: Literal["whitelist", "blacklist"] = "whitelist",
-        connections: Connections = {},
-        control_behavior: Format.ControlBehavior = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        connections: Optional[Connections] = None,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -134,10 +132,10 @@ class FilterInserter(
             tile_position=tile_position,
             direction=direction,
             override_stack_size=override_stack_size,
-            filters=filters,
-            connections=connections,
-            control_behavior=control_behavior,
-            tags=tags,
+            filters=[] if filters is None else filters,
+            connections={} if connections is None else connections,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -181,7 +179,5 @@ class FilterInserter(
 
     # =========================================================================
 
-    __hash__ = Entity.__hash__
-
     def __eq__(self, other) -> bool:
         return super().__eq__(other) and self.filter_mode == other.filter_mode
@@ -3,7 +3,7 @@
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import EquipmentGridMixin, OrientationMixin
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Orientation, ValidationMode
+from draftsman.constants import Orientation, ValidationMode, ValidationSetting
 from draftsman.utils import get_first
 from draftsman.warning import DraftsmanWarning
 
@@ -28,11 +28,9 @@ class FluidWagon(OrientationMixin, Entity):
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         orientation: Orientation = Orientation.NORTH,
         enable_logistics_while_moving: Optional[bool] = True,
-        grid: list[Format.EquipmentComponent] = [],
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        grid: Optional[list[Format.EquipmentComponent]] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -46,13 +44,11 @@ class FluidWagon(OrientationMixin, Entity):
             tile_position=tile_position,
             orientation=orientation,
             enable_logistics_while_moving=enable_logistics_while_moving,
-            grid=grid,
-            tags=tags,
+            grid=[] if grid is None else grid,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
         self.validate_assignment = validate_assignment
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
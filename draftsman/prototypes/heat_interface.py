@@ -3,7 +3,7 @@
 from draftsman.classes.entity import Entity
 from draftsman.classes.exportable import attempt_and_reissue
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.utils import get_first
 from draftsman.warning import TemperatureRangeWarning
 
@@ -65,10 +65,8 @@ class HeatInterface(Entity):
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         temperature: float = 0.0,
         mode: Literal["at-least", "at-most", "exactly", "add", "remove"] = "at-least",
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -81,7 +79,7 @@ class HeatInterface(Entity):
             heat_interfaces,
             position=position,
             tile_position=tile_position,
-            tags=tags,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -164,8 +162,6 @@ class HeatInterface(Entity):
 
     # =========================================================================
 
-    __hash__ = Entity.__hash__
-
     def __eq__(self, other) -> bool:
         return (
             super().__eq__(other)
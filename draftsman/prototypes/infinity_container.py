@@ -4,7 +4,7 @@ from draftsman.classes.entity import Entity
 from draftsman.classes.exportable import attempt_and_reissue, test_replace_me
 from draftsman.classes.mixins import RequestItemsMixin, InventoryMixin
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.error import DataFormatError
 from draftsman.signatures import DraftsmanBaseModel, ItemRequest, uint16, uint32
 from draftsman.utils import get_first
@@ -80,12 +80,10 @@ class InfinityContainer(RequestItemsMixin, InventoryMixin, Entity):
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         bar: uint16 = None,
-        items: Optional[list[ItemRequest]] = [],  # TODO: ItemID
-        infinity_settings: Format.InfinitySettings = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        items: Optional[list[ItemRequest]] = None,  # TODO: ItemID
+        infinity_settings: Optional[Format.InfinitySettings] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -100,12 +98,12 @@ class InfinityContainer(RequestItemsMixin, InventoryMixin, Entity):
             position=position,
             tile_position=tile_position,
             bar=bar,
-            items=items,
-            tags=tags,
+            items=[] if items is None else items,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
-        self.infinity_settings = infinity_settings
+        self.infinity_settings = {} if infinity_settings is None else infinity_settings
 
         self.validate_assignment = validate_assignment
 
@@ -232,8 +230,6 @@ class InfinityContainer(RequestItemsMixin, InventoryMixin, Entity):
 
     # =========================================================================
 
-    __hash__ = Entity.__hash__
-
     def __eq__(self, other) -> bool:
         return (
             super().__eq__(other) and self.infinity_settings == other.infinity_settings
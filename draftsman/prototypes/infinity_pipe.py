@@ -3,7 +3,7 @@
 from draftsman.classes.entity import Entity
 from draftsman.classes.exportable import attempt_and_reissue, test_replace_me
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.signatures import DraftsmanBaseModel, int64, FluidName
 from draftsman.utils import get_first
 
@@ -97,11 +97,9 @@ class InfinityPipe(Entity):
         name: Optional[str] = get_first(infinity_pipes),
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
-        infinity_settings: Format.InfinitySettings = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        infinity_settings: Optional[Format.InfinitySettings] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -115,11 +113,11 @@ class InfinityPipe(Entity):
             infinity_pipes,
             position=position,
             tile_position=tile_position,
-            tags=tags,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
-        self.infinity_settings = infinity_settings
+        self.infinity_settings = {} if infinity_settings is None else infinity_settings
 
         self.validate_assignment = validate_assignment
 
@@ -363,8 +361,6 @@ class InfinityPipe(Entity):
 
     # =========================================================================
 
-    __hash__ = Entity.__hash__
-
     def __eq__(self, other) -> bool:
         return (
             super().__eq__(other) and self.infinity_settings == other.infinity_settings
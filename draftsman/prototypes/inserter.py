@@ -15,7 +15,7 @@ from draftsman.classes.mixins import (
     DirectionalMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.signatures import DraftsmanBaseModel, uint8
 from draftsman.utils import get_first
 
@@ -122,11 +122,9 @@ class Inserter(
         filter_mode: Literal["whitelist", "blacklist"] = "whitelist",
         spoil_priority: Literal["spoiled-first", "fresh-first", None] = None,
         override_stack_size: uint8 = None,
-        control_behavior: Format.ControlBehavior = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         super().__init__(
@@ -136,8 +134,8 @@ class Inserter(
             tile_position=tile_position,
             direction=direction,
             override_stack_size=override_stack_size,
-            control_behavior=control_behavior,
-            tags=tags,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -289,5 +287,3 @@ class Inserter(
         self.filter_mode = other.filter_mode
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
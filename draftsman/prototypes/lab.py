@@ -3,7 +3,7 @@
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import ModulesMixin, RequestItemsMixin
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.signatures import ItemRequest, uint32
 from draftsman.utils import get_first, reissue_warnings
 from draftsman.warning import ItemLimitationWarning
@@ -33,11 +33,9 @@ class Lab(ModulesMixin, RequestItemsMixin, Entity):
         name: Optional[str] = get_first(labs),
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
-        items: Optional[list[ItemRequest]] = [],  # TODO: ItemID
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        items: Optional[list[ItemRequest]] = None,  # TODO: ItemID
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -49,8 +47,8 @@ class Lab(ModulesMixin, RequestItemsMixin, Entity):
             labs,
             position=position,
             tile_position=tile_position,
-            items=items,
-            tags=tags,
+            items=[] if items is None else items,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -96,5 +94,3 @@ class Lab(ModulesMixin, RequestItemsMixin, Entity):
         # version.
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
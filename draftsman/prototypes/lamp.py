@@ -8,7 +8,7 @@ from draftsman.classes.mixins import (
     CircuitConnectableMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode, LampColorMode
+from draftsman.constants import LampColorMode, ValidationMode, ValidationSetting
 from draftsman.signatures import Color, Connections, DraftsmanBaseModel
 from draftsman.utils import get_first
 
@@ -70,11 +70,9 @@ class Lamp(
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         always_on: Optional[bool] = False,
-        control_behavior: Format.ControlBehavior = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -89,8 +87,8 @@ class Lamp(
             lamps,
             position=position,
             tile_position=tile_position,
-            control_behavior=control_behavior,
-            tags=tags,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -175,5 +173,3 @@ class Lamp(
         self._root.color = value
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
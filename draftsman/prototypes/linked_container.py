@@ -4,7 +4,7 @@ from draftsman.classes.entity import Entity
 from draftsman.classes.exportable import attempt_and_reissue
 from draftsman.classes.mixins import InventoryMixin, RequestItemsMixin
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.signatures import ItemRequest, uint16, uint32
 from draftsman.utils import get_first
 
@@ -50,11 +50,9 @@ class LinkedContainer(InventoryMixin, RequestItemsMixin, Entity):
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         bar: uint16 = None,
         link_id: uint32 = 0,
-        items: Optional[list[ItemRequest]] = [],
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        items: Optional[list[ItemRequest]] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -69,8 +67,8 @@ class LinkedContainer(InventoryMixin, RequestItemsMixin, Entity):
             position=position,
             tile_position=tile_position,
             bar=bar,
-            items=items,
-            tags=tags,
+            items=[] if items is None else items,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -137,7 +135,5 @@ class LinkedContainer(InventoryMixin, RequestItemsMixin, Entity):
 
     # =========================================================================
 
-    __hash__ = Entity.__hash__
-
     def __eq__(self, other: "LinkedContainer") -> bool:
         return super().__eq__(other) and self.link_id == other.link_id
@@ -3,7 +3,7 @@
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import FiltersMixin, IOTypeMixin, DirectionalMixin
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.signatures import FilterEntry
 from draftsman.utils import get_first
 
@@ -34,11 +34,9 @@ class Loader(FiltersMixin, IOTypeMixin, DirectionalMixin, Entity):
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         direction: Direction = Direction.NORTH,
         io_type: Literal["input", "output"] = "input",
-        filters: list[FilterEntry] = [],
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        filters: Optional[list[FilterEntry]] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         super().__init__(
@@ -48,13 +46,11 @@ class Loader(FiltersMixin, IOTypeMixin, DirectionalMixin, Entity):
             tile_position=tile_position,
             direction=direction,
             io_type=io_type,
-            filters=filters,
-            tags=tags,
+            filters=[] if filters is None else filters,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
         self.validate_assignment = validate_assignment
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
@@ -8,7 +8,7 @@ from draftsman.classes.mixins import (
     OrientationMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Orientation, ValidationMode
+from draftsman.constants import Orientation, ValidationMode, ValidationSetting
 from draftsman.signatures import ItemRequest
 from draftsman.utils import get_first
 
@@ -41,12 +41,10 @@ class Locomotive(
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         orientation: Orientation = Orientation.NORTH,
         enable_logistics_while_moving: Optional[bool] = True,
-        grid: list[Format.EquipmentComponent] = [],
-        items: Optional[list[ItemRequest]] = [],
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        grid: Optional[list[Format.EquipmentComponent]] = None,
+        items: Optional[list[ItemRequest]] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         super().__init__(
@@ -56,9 +54,9 @@ class Locomotive(
             tile_position=tile_position,
             orientation=orientation,
             enable_logistics_while_moving=enable_logistics_while_moving,
-            grid=grid,
-            items=items,
-            tags=tags,
+            grid=[] if grid is None else grid,
+            items=[] if items is None else items,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -67,5 +65,3 @@ class Locomotive(
     # TODO: check if item requests are valid fuel sources or not
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
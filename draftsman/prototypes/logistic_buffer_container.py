@@ -10,7 +10,7 @@ from draftsman.classes.mixins import (
     InventoryMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import LogisticModeOfOperation, ValidationMode
+from draftsman.constants import LogisticModeOfOperation, ValidationMode, ValidationSetting
 from draftsman.error import DataFormatError
 from draftsman.signatures import (
     DraftsmanBaseModel,
@@ -61,13 +61,11 @@ class LogisticBufferContainer(
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         bar: uint16 = None,
-        request_filters: list[RequestFilter] = [],
-        items: Optional[list[ItemRequest]] = {},
-        control_behavior: Format.ControlBehavior = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        request_filters: Optional[list[RequestFilter]] = None,
+        items: Optional[list[ItemRequest]] = None,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -80,15 +78,13 @@ class LogisticBufferContainer(
             position=position,
             tile_position=tile_position,
             bar=bar,
-            request_filters=request_filters,
-            items=items,
-            control_behavior=control_behavior,
-            tags=tags,
+            request_filters=[] if request_filters is None else request_filters,
+            items={} if items is None else items,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
         self.validate_assignment = validate_assignment
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
@@ -7,7 +7,7 @@ from draftsman.classes.mixins import (
     InventoryMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.data.entities import of_type
 from draftsman.signatures import ItemRequest, uint16
 from draftsman.utils import get_first
@@ -40,11 +40,9 @@ class LogisticPassiveContainer(
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         bar: uint16 = None,
-        items: Optional[list[ItemRequest]] = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        items: Optional[list[ItemRequest]] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         super().__init__(
@@ -53,13 +51,11 @@ class LogisticPassiveContainer(
             position=position,
             tile_position=tile_position,
             bar=bar,
-            items=items,
-            tags=tags,
+            items={} if items is None else items,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
         self.validate_assignment = validate_assignment
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
@@ -11,7 +11,7 @@ from draftsman.classes.mixins import (
     InventoryMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.signatures import (
     DraftsmanBaseModel,
     ItemRequest,
@@ -70,14 +70,12 @@ class LogisticRequestContainer(
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         bar: uint16 = None,
-        request_filters: list[RequestFilter] = [],
-        items: Optional[list[ItemRequest]] = {},
-        control_behavior: Format.ControlBehavior = {},
+        request_filters: Optional[list[RequestFilter]] = None,
+        items: Optional[list[ItemRequest]] = None,
+        control_behavior: Optional[Format.ControlBehavior] = None,
         request_from_buffers: bool = False,
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         self._root: __class__.Format
@@ -88,10 +86,10 @@ class LogisticRequestContainer(
             position=position,
             tile_position=tile_position,
             bar=bar,
-            request_filters=request_filters,
-            items=items,
-            control_behavior=control_behavior,
-            tags=tags,
+            request_filters=[] if request_filters is None else request_filters,
+            items={} if items is None else items,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -125,8 +123,6 @@ class LogisticRequestContainer(
 
     # =========================================================================
 
-    __hash__ = Entity.__hash__
-
     def __eq__(self, other) -> bool:
         return (
             super().__eq__(other)
@@ -8,7 +8,7 @@ from draftsman.classes.mixins import (
     InventoryMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.signatures import ItemRequest, RequestFilter, uint16
 from draftsman.utils import get_first
 
@@ -45,12 +45,10 @@ class LogisticStorageContainer(
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         bar: Optional[uint16] = None,
-        request_filters: list[RequestFilter] = [],
-        items: Optional[list[ItemRequest]] = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        request_filters: Optional[list[RequestFilter]] = None,
+        items: Optional[list[ItemRequest]] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -63,14 +61,12 @@ class LogisticStorageContainer(
             position=position,
             tile_position=tile_position,
             bar=bar,
-            request_filters=request_filters,
-            items=items,
-            tags=tags,
+            request_filters=[] if request_filters is None else request_filters,
+            items={} if items is None else items,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
         self.validate_assignment = validate_assignment
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
@@ -14,7 +14,7 @@ from draftsman.classes.mixins import (
     DirectionalMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.signatures import Connections, DraftsmanBaseModel, ItemRequest
 from draftsman.utils import get_first
 
@@ -73,12 +73,10 @@ class MiningDrill(
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         direction: Direction = Direction.NORTH,
-        items: Optional[list[ItemRequest]] = [],  # TODO: ItemID
-        control_behavior: Format.ControlBehavior = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        items: Optional[list[ItemRequest]] = None,  # TODO: ItemID
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -91,9 +89,9 @@ class MiningDrill(
             position=position,
             tile_position=tile_position,
             direction=direction,
-            items=items,
-            control_behavior=control_behavior,
-            tags=tags,
+            items=[] if items is None else items,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -125,5 +123,3 @@ class MiningDrill(
     #     super().set_item_request(item, count)
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
@@ -11,7 +11,7 @@ from draftsman.classes.mixins import (
     # DirectionalMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.data import entities
 from draftsman.signatures import Connections, DraftsmanBaseModel
 from draftsman.utils import get_first
@@ -67,12 +67,10 @@ class PowerSwitch(
         name: Optional[str] = get_first(power_switches),
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
-        control_behavior: Format.ControlBehavior = {},
+        control_behavior: Optional[Format.ControlBehavior] = None,
         switch_state: bool = False,
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         super().__init__(
@@ -80,8 +78,8 @@ class PowerSwitch(
             power_switches,
             position=position,
             tile_position=tile_position,
-            control_behavior=control_behavior,
-            tags=tags,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -147,7 +145,5 @@ class PowerSwitch(
 
     # =========================================================================
 
-    __hash__ = Entity.__hash__
-
     def __eq__(self, other) -> bool:
         return super().__eq__(other) and self.switch_state == other.switch_state
@@ -9,7 +9,7 @@ from draftsman.classes.mixins import (
     CircuitEnableMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.signatures import Connections, DraftsmanBaseModel, SignalID, uint32
 from draftsman.utils import get_first
 from draftsman.warning import (
@@ -335,13 +335,11 @@ class ProgrammableSpeaker(
         name: Optional[str] = get_first(programmable_speakers),
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
-        control_behavior: Format.ControlBehavior = {},
-        parameters: Format.Parameters = {},
-        alert_parameters: Format.AlertParameters = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        parameters: Optional[Format.Parameters] = None,
+        alert_parameters: Optional[Format.AlertParameters] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -355,8 +353,8 @@ class ProgrammableSpeaker(
             programmable_speakers,
             position=position,
             tile_position=tile_position,
-            control_behavior=control_behavior,
-            tags=tags,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -369,8 +367,8 @@ class ProgrammableSpeaker(
                 notes.add(note["name"])
             self._instruments[instrument["name"]] = notes
 
-        self.parameters = parameters
-        self.alert_parameters = alert_parameters
+        self.parameters = {} if parameters is None else parameters
+        self.alert_parameters = {} if alert_parameters is None else alert_parameters
 
         self.validate_assignment = validate_assignment
 
@@ -840,8 +838,6 @@ class ProgrammableSpeaker(
 
     # =========================================================================
 
-    __hash__ = Entity.__hash__
-
     def __eq__(self, other) -> bool:
         return (
             super().__eq__(other)
@@ -9,7 +9,7 @@ from draftsman.classes.mixins import (
     EightWayDirectionalMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.signatures import Connections, DraftsmanBaseModel, SignalID
 from draftsman.utils import get_first
 
@@ -56,11 +56,9 @@ class RailChainSignal(
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         direction: Direction = Direction.NORTH,
-        control_behavior: Format.ControlBehavior = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -80,8 +78,8 @@ class RailChainSignal(
             position=position,
             tile_position=tile_position,
             direction=direction,
-            control_behavior=control_behavior,
-            tags=tags,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -127,5 +125,3 @@ class RailChainSignal(
             self.control_behavior.blue_output_signal = value
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
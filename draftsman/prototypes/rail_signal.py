@@ -11,7 +11,7 @@ from draftsman.classes.mixins import (
     EightWayDirectionalMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.signatures import Connections, DraftsmanBaseModel
 from draftsman.utils import get_first
 
@@ -75,11 +75,9 @@ class RailSignal(
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         direction: Direction = Direction.NORTH,
-        control_behavior: Format.ControlBehavior = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -99,8 +97,8 @@ class RailSignal(
             position=position,
             tile_position=tile_position,
             direction=direction,
-            control_behavior=control_behavior,
-            tags=tags,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -158,5 +156,3 @@ class RailSignal(
             self.control_behavior.circuit_read_signal = value
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
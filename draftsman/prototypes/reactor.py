@@ -9,7 +9,7 @@ from draftsman.classes.mixins import (
     CircuitConnectableMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.signatures import DraftsmanBaseModel, ItemRequest, SignalID
 from draftsman.utils import get_first
 
@@ -60,12 +60,10 @@ class Reactor(
         name: Optional[str] = get_first(reactors),
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
-        items: Optional[list[ItemRequest]] = [],
-        control_behavior: Optional[Format.ControlBehavior] = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        items: Optional[list[ItemRequest]] = None,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -77,9 +75,9 @@ class Reactor(
             reactors,
             position=position,
             tile_position=tile_position,
-            items=items,
-            control_behavior=control_behavior,
-            tags=tags,
+            items=[] if items is None else items,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -166,5 +164,3 @@ class Reactor(
             self.control_behavior.temperature_signal = value
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
@@ -7,7 +7,7 @@ from draftsman.classes.entity import Entity
 from draftsman.classes.exportable import attempt_and_reissue
 from draftsman.classes.mixins import ControlBehaviorMixin, CircuitConnectableMixin
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.signatures import Connections, DraftsmanBaseModel, SignalID
 from draftsman.utils import get_first
 
@@ -77,11 +77,9 @@ class Roboport(ControlBehaviorMixin, CircuitConnectableMixin, Entity):
         name: Optional[str] = get_first(roboports),
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
-        control_behavior: Format.ControlBehavior = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -95,8 +93,8 @@ class Roboport(ControlBehaviorMixin, CircuitConnectableMixin, Entity):
             roboports,
             position=position,
             tile_position=tile_position,
-            control_behavior=control_behavior,
-            tags=tags,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -291,5 +289,3 @@ class Roboport(ControlBehaviorMixin, CircuitConnectableMixin, Entity):
             self.control_behavior.total_construction_output_signal = value
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
@@ -10,7 +10,7 @@ from draftsman.classes.mixins import (
     RecipeMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import SiloReadMode, ValidationMode
+from draftsman.constants import SiloReadMode, ValidationMode, ValidationSetting
 from draftsman.signatures import DraftsmanBaseModel, ItemRequest, uint32
 from draftsman.utils import get_first
 
@@ -70,12 +70,10 @@ class RocketSilo(
         ] = "normal",
         # auto_launch: bool = False,
         transitional_request_index: Optional[uint32] = 0,
-        items: Optional[list[ItemRequest]] = [],
-        control_behavior: Optional[Format.ControlBehavior] = {},
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        items: Optional[list[ItemRequest]] = None,
+        control_behavior: Optional[Format.ControlBehavior] = None,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -92,9 +90,9 @@ class RocketSilo(
             tile_position=tile_position,
             recipe=recipe,
             recipe_quality=recipe_quality,
-            items=items,
-            control_behavior=control_behavior,
-            tags=tags,
+            items=[] if items is None else items,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -180,8 +178,6 @@ class RocketSilo(
 
     # =========================================================================
 
-    __hash__ = Entity.__hash__
-
     def __eq__(self, other: "RocketSilo") -> bool:
         return (
             super().__eq__(other)
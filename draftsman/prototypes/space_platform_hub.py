@@ -8,7 +8,7 @@ from draftsman.classes.mixins import (
     CircuitConnectableMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import ValidationMode
+from draftsman.constants import ValidationMode, ValidationSetting
 from draftsman.signatures import DraftsmanBaseModel, SignalID
 from draftsman.utils import get_first
 
@@ -79,12 +79,10 @@ class SpacePlatformHub(
         name: Optional[str] = get_first(space_platform_hubs),
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
-        control_behavior: Optional[Format.ControlBehavior] = {},
+        control_behavior: Optional[Format.ControlBehavior] = None,
         request_missing_construction_materials: Optional[bool] = True,
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -97,8 +95,8 @@ class SpacePlatformHub(
             similar_entities=space_platform_hubs,
             position=position,
             tile_position=tile_position,
-            control_behavior=control_behavior,
-            tags=tags,
+            control_behavior={} if control_behavior is None else control_behavior,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -132,5 +130,3 @@ class SpacePlatformHub(
             self._root.request_missing_construction_materials = value
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
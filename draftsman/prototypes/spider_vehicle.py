@@ -10,7 +10,7 @@ from draftsman.classes.mixins import (
     OrientationMixin,
 )
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Orientation, ValidationMode
+from draftsman.constants import Orientation, ValidationMode, ValidationSetting
 from draftsman.signatures import DraftsmanBaseModel, Section, uint32
 from draftsman.utils import Vector, PrimitiveVector, get_first
 
@@ -82,18 +82,16 @@ class SpiderVehicle(
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         orientation: Optional[Orientation] = Orientation.NORTH,
         enable_logistics_while_moving: Optional[bool] = True,
-        grid: list[Format.EquipmentComponent] = [],
+        grid: Optional[list[Format.EquipmentComponent]] = None,
         trunk_inventory=None,
         ammo_inventory=None,
         driver_is_main_gunner: Optional[bool] = True,
         selected_gun_index: Optional[uint32] = 1,  # TODO: size
-        automatic_targeting_parameters: Format.AutoTargetParameters = {},
-        request_filters: Format.RequestFilters = {},
-        items: dict[str, uint32] = {},  # TODO: ItemID
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        automatic_targeting_parameters: Optional[Format.AutoTargetParameters] = None,
+        request_filters: Optional[Format.RequestFilters] = None,
+        items: Optional[dict[str, uint32]] = None,  # TODO: ItemID
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -106,18 +104,18 @@ class SpiderVehicle(
             tile_position=tile_position,
             orientation=orientation,
             enable_logistics_while_moving=enable_logistics_while_moving,
-            grid=grid,
+            grid=[] if grid is None else grid,
             trunk_inventory=trunk_inventory,
             ammo_inventory=ammo_inventory,
             driver_is_main_gunner=driver_is_main_gunner,
             selected_gun_index=selected_gun_index,
-            items=items,
-            tags=tags,
+            items={} if items is None else items,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
-        self.automatic_targeting_parameters = automatic_targeting_parameters
-        self.request_filters = request_filters
+        self.automatic_targeting_parameters = {} if automatic_targeting_parameters is None else automatic_targeting_parameters
+        self.request_filters = [] if request_filters is None else request_filters
 
         self.validate_assignment = validate_assignment
 
@@ -193,5 +191,3 @@ class SpiderVehicle(
             self.automatic_targeting_parameters.auto_target_with_gunner = value
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
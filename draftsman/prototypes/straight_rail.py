@@ -4,7 +4,7 @@ from draftsman.classes.collision_set import CollisionSet
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import DoubleGridAlignedMixin, EightWayDirectionalMixin
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.constants import Direction, ValidationMode
+from draftsman.constants import Direction, ValidationMode, ValidationSetting
 from draftsman.utils import AABB, Rectangle, get_first
 
 from draftsman.data.entities import straight_rails
@@ -58,10 +58,8 @@ class StraightRail(DoubleGridAlignedMixin, EightWayDirectionalMixin, Entity):
         position: Union[Vector, PrimitiveVector] = None,
         tile_position: Union[Vector, PrimitiveVector] = (0, 0),
         direction: Direction = Direction.NORTH,
-        tags: dict[str, Any] = {},
-        validate_assignment: Union[
-            ValidationMode, Literal["none", "minimum", "strict", "pedantic"]
-        ] = ValidationMode.STRICT,
+        tags: Optional[dict[str, Any]] = None,
+        validate_assignment: ValidationSetting = ValidationMode.STRICT,
         **kwargs
     ):
         """
@@ -88,7 +86,7 @@ class StraightRail(DoubleGridAlignedMixin, EightWayDirectionalMixin, Entity):
             position=position,
             tile_position=tile_position,
             direction=direction,
-            tags=tags,
+            tags={} if tags is None else tags,
             **kwargs
         )
 
@@ -101,5 +99,3 @@ class StraightRail(DoubleGridAlignedMixin, EightWayDirectionalMixin, Entity):
         return _collision_set_rotation.get(self.direction, None)
 
     # =========================================================================
-
-    __hash__ = Entity.__hash__
@@ -53,8 +53,8 @@ from pydantic import (
 from pydantic.functional_validators import AfterValidator
 from pydantic.json_schema import JsonSchemaValue
 from pydantic_core import CoreSchema
+from functools import lru_cache
 from textwrap import dedent
-from thefuzz import process
 from typing import Any, Literal, Optional, Sequence, Union
 
 
@@ -103,9 +103,6 @@ def known_name(type: str, structure: dict, issued_warning):
 ItemName = Annotated[
     str, AfterValidator(known_name("item", items.raw, UnknownItemWarning))
 ]
-SignalName = Annotated[
-    str, AfterValidator(known_name("signal", signals.raw, UnknownSignalWarning))
-]
 EntityName = Annotated[
     str, AfterValidator(known_name("entity", entities.raw, UnknownEntityWarning))
 ]
@@ -127,16 +124,14 @@ class DraftsmanBaseModel(BaseModel):
     """
 
     @classmethod
-    # @lru_cache(maxsize=None)  # maybe excessive...
-    # def get_model_aliases(cls) -> list[str]:
-    #     """
-    #     Similar to ``cls.model_fields``, but converts everything to their
-    #     aliases if present.
-    #     """
-    #     return [
-    #         v.alias if v.alias is not None else k for k, v in cls.model_fields.items()
-    #     ]
+    @lru_cache(maxsize=None)
     def true_model_fields(cls):
+        """
+        Similar to ``cls.model_fields``, but keyed by each field's alias when
+        one exists. Aliases are fixed at class creation, so the mapping is
+        computed once per class; dict-style access on models goes through it
+        on every call.
+        """
         return {
             (v.alias if v.alias is not None else k): k
             for k, v in cls.model_fields.items()
@@ -167,12 +162,18 @@ class DraftsmanBaseModel(BaseModel):
         does not recognize. Because Factorio (seems to) permit extra keys, doing
         so will issue warnings instead of exceptions.
         """
-        if not info.context:
+        # Check the extra keys first; it's the cheapest rejection and almost
+        # every model validated has none, making the context lookups below
+        # pure overhead in the common case
+        if not self.model_extra:
             return self
-        if info.context["mode"] <= ValidationMode.MINIMUM:
+        context = info.context
+        if not context:
+            return self
+        if context["mode"] <= ValidationMode.MINIMUM:
             return self
 
-        obj = info.context["object"]
+        obj = context["object"]
 
         # If we're creating a generic `Entity` (in the case where Draftsman
         # cannot really know what entity is being imported) then we don't want
@@ -184,21 +185,20 @@ class DraftsmanBaseModel(BaseModel):
         # We also only want to issue this particular warning if we're setting an
         # assignment of a subfield, or if we're doing a full scale `validate()`
         # function call
-        if type(obj).Format is type(self) and info.context["assignment"]:
+        if type(obj).Format is type(self) and context["assignment"]:
             return self
 
-        if self.model_extra:
-            warning_list: list = info.context["warning_list"]
+        warning_list: list = context["warning_list"]
 
-            warning_list.append(
-                UnknownKeywordWarning(
-                    "'{}' object has no attribute(s) {}; allowed fields are {}".format(
-                        self.model_config.get("title", type(self).__name__),
-                        list(self.model_extra.keys()),
-                        list(self.true_model_fields().keys()),
-                    )
+        warning_list.append(
+            UnknownKeywordWarning(
+                "'{}' object has no attribute(s) {}; allowed fields are {}".format(
+                    self.model_config.get("title", type(self).__name__),
+                    list(self.model_extra.keys()),
+                    list(self.true_model_fields().keys()),
                 )
             )
+        )
 
         return self
 
@@ -347,7 +347,7 @@ class Mapper(DraftsmanBaseModel):
 
 
 class SignalID(DraftsmanBaseModel):
-    name: Optional[SignalName] = Field(
+    name: Optional[str] = Field(
         ...,
         description="""
         Name of the signal. If omitted, the signal is treated as no signal and 
@@ -434,25 +434,41 @@ class SignalID(DraftsmanBaseModel):
     @classmethod
     def check_type_matches_name(cls, value: "SignalID", info: ValidationInfo):
         """
-        Idiot-check to make sure that the ``type`` of a known signal actually
-        corresponds to it's ``name``; prevents silly mistakes like::
+        Warns if the signal's ``name`` is unrecognized, and for known signals
+        idiot-checks that the ``type`` actually corresponds to that ``name``;
+        prevents silly mistakes like::
 
             {"name": "signal-A", "type": "fluid"}
+
+        Both checks live in one validator so that ``signals.raw`` is only
+        consulted once per ``SignalID``.
         """
         if not info.context:
             return value
         if info.context["mode"] <= ValidationMode.MINIMUM:
             return value
 
+        name = value["name"]
+        if name is None:
+            return value
+
         warning_list: list = info.context["warning_list"]
 
-        if value["name"] in signals.raw:
-            expected_types = get_signal_types(value["name"])
+        if name not in signals.raw:
+            warning_list.append(
+                UnknownSignalWarning(
+                    "Unknown signal '{}'{}".format(
+                        name, get_suggestion(name, signals.raw.keys(), n=1)
+                    )
+                )
+            )
+        else:
+            expected_types = get_signal_types(name)
             if value["type"] not in expected_types:
                 warning_list.append(
                     MalformedSignalWarning(
                         "Known signal '{}' was given a mismatching type (expected one of {}, found '{}')".format(
-                            value["name"], expected_types, value["type"]
+                            name, expected_types, value["type"]
                         )
                     )
                 )
@@ -538,6 +554,9 @@ def normalize_icons(value: Any):
 
 
 def normalize_version(value: Any):
+    if isinstance(value, int):
+        # Already encoded; skip the (exception-based) sequence path entirely
+        return value
     try:
         return encode_version(*value)
     except Exception:
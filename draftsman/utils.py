@@ -13,14 +13,21 @@ from abc import ABCMeta, abstractmethod
 import base64
 import json
 import math
-from functools import wraps
+from functools import lru_cache, wraps
 
 # import six
-from thefuzz import process
+from rapidfuzz import process
 from typing import Optional, Union, TYPE_CHECKING
 import warnings
 import zlib
 
+try:  # pragma: no coverage
+    # Considerably faster for encoding/decoding blueprint strings, but
+    # entirely optional
+    import orjson
+except ImportError:  # pragma: no coverage
+    orjson = None
+
 if TYPE_CHECKING:  # pragma: no coverage
     from draftsman.classes.entity_like import EntityLike
     from draftsman.entity import Entity
@@ -391,7 +398,10 @@ def string_to_JSON(string: str) -> dict:
         decodable to a JSON object.
     """
     try:
-        return json.loads(zlib.decompress(base64.b64decode(string[1:])))
+        decompressed = zlib.decompress(base64.b64decode(string[1:]))
+        if orjson is not None:
+            return orjson.loads(decompressed)
+        return json.loads(decompressed)
     except Exception as e:
         raise MalformedBlueprintStringError(e)
 
@@ -415,9 +425,16 @@ def JSON_to_string(JSON: dict) -> str:
 
     :returns: A ``str`` which can be imported into Factorio.
     """
-    return "0" + base64.b64encode(
-        zlib.compress(json.dumps(JSON, separators=(",", ":")).encode("utf-8"), 9)
-    ).decode("utf-8")
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(JSON)
+        except TypeError:
+            # orjson is stricter than the stdlib about input types (e.g.
+            # non-string dict keys); mirror the old behavior in that case
+            encoded = json.dumps(JSON, separators=(",", ":")).encode("utf-8")
+    else:
+        encoded = json.dumps(JSON, separators=(",", ":")).encode("utf-8")
+    return "0" + base64.b64encode(zlib.compress(encoded, 9)).decode("utf-8")
 
 
 def encode_version(major: int, minor: int, patch: int = 0, dev_ver: int = 0) -> int:
@@ -439,6 +456,7 @@ def encode_version(major: int, minor: int, patch: int = 0, dev_ver: int = 0) ->
     return (major << 48) | (minor << 32) | (patch << 16) | (dev_ver)
 
 
+@lru_cache(maxsize=256)
 def decode_version(version_number: int) -> tuple[int, int, int, int]:
     """
     Converts version number to version components.
@@ -446,6 +464,9 @@ def decode_version(version_number: int) -> tuple[int, int, int, int]:
     as a 4-length tuple, which is usually more readable than the combined
     format.
 
+    Memoized, since in practice only a handful of distinct version numbers
+    are ever decoded but blueprints consult theirs repeatedly.
+
     For the inverse operation, see :py:func:`encode_version`.
 
     :param version_number: The version number to decode.
@@ -760,6 +781,42 @@ def extend_aabb(a: Optional[AABB], b: Optional[AABB]) -> Optional[AABB]:
         )
 
 
+def aabb_union(boxes) -> Optional[AABB]:
+    """
+    Folds an iterable of bounding boxes into the minimum :py:class:`.AABB`
+    which encompasses all of them, ignoring any ``None`` entries. Equivalent
+    to repeatedly calling :py:func:`extend_aabb`, but only allocates the
+    single resulting box instead of one intermediate per step.
+
+    :param boxes: An iterable of :py:class:`.AABB` instances (or ``None``).
+
+    :returns: The minimum bounding :py:class:`.AABB`, or ``None`` if no
+        non-``None`` box was encountered.
+    """
+    min_x = min_y = math.inf
+    max_x = max_y = -math.inf
+    found = False
+    for box in boxes:
+        if box is None:
+            continue
+        found = True
+        top_left = box.world_top_left
+        bot_right = box.world_bot_right
+        if top_left[0] < min_x:
+            min_x = top_left[0]
+        if top_left[1] < min_y:
+            min_y = top_left[1]
+        if bot_right[0] > max_x:
+            max_x = bot_right[0]
+        if bot_right[1] > max_y:
+            max_y = bot_right[1]
+
+    if not found:
+        return None
+
+    return AABB(min_x, min_y, max_x, max_y)
+
+
 def aabb_to_dimensions(aabb: Optional[AABB]) -> tuple[int, int]:
     """
     Gets the tile-dimensions of an AABB, or the minimum number of tiles across
@@ -815,11 +872,15 @@ def flatten_entities(entities: "list[EntityLike | list[EntityLike]]") -> "list[E
 
     :returns: A ``list`` containing all the entities in depth-first sequence.
     """
+    # Traversal is done with an explicit stack rather than recursion, which
+    # avoids Python call-frame overhead and the recursion limit on deeply
+    # nested groups
     out = []
-    for entity in entities:
-        result = entity.get()
+    stack = list(reversed(entities))
+    while stack:
+        result = stack.pop().get()
         if isinstance(result, list):
-            out.extend(flatten_entities(result))
+            stack.extend(reversed(result))
         else:
             out.append(result)
     return out
@@ -923,6 +984,20 @@ def reissue_warnings(func):
     return inner
 
 
+@lru_cache(maxsize=1024)
+def _get_suggestions(name, choices, n, cutoff):
+    """
+    Memoized fuzzy search backing :py:func:`get_suggestion`. The Levenshtein
+    sweep over ``choices`` is orders of magnitude more expensive than an exact
+    lookup, and the same unknown name is typically queried against the same
+    (static) data table many times when importing a malformed blueprint.
+    """
+    return [
+        suggestion[0]
+        for suggestion in process.extract(name, choices, limit=n, score_cutoff=cutoff)
+    ]
+
+
 def get_suggestion(name, choices, n=3, cutoff=60):
     """
     Looks for similarly-named strings from ``choices`` and suggests ``n``
@@ -938,11 +1013,10 @@ def get_suggestion(name, choices, n=3, cutoff=60):
     :returns: A string intended to be appended to an error or warning message,
         containing the suggested alternative(s).
     """
-    suggestions = [
-        suggestion[0]
-        for suggestion in process.extract(name, choices, limit=n)
-        if suggestion[1] >= cutoff
-    ]
+    # `choices` is frequently a dict keys view; snapshot it to something
+    # hashable so repeated queries hit the cache (and so mutated data tables
+    # naturally miss it)
+    suggestions = _get_suggestions(name, tuple(choices), n, cutoff)
     if len(suggestions) == 0:
         return ""
     elif len(suggestions) == 1:
@@ -63,7 +63,7 @@ setup(
         "GitPython >= 3.1.43",
         "typing",
         "typing_extensions; python_version < '3.8'",
-        "thefuzz",
+        "rapidfuzz",
         # "importlib-resources; python_version < '3.7'",
         # "enum34; python_version < '3.4'",
         # "future; python_version < '3.0'",
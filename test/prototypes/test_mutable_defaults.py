@@ -0,0 +1,36 @@
+# test_mutable_defaults.py
+
+"""
+Constructor defaults for ``tags``, ``items``, ``control_behavior``, ``grid``
+and friends used to be shared ``{}``/``[]`` literals, so mutating one
+default-constructed instance leaked into every instance constructed after it.
+These tests guard against that regressing if the ``None``-sentinel signatures
+are ever "simplified" back to literal defaults.
+"""
+
+from draftsman.entity import Accumulator, AssemblingMachine, SpiderVehicle
+
+
+class TestMutableDefaults:
+    def test_tags_not_shared(self):
+        accumulator = Accumulator()
+        accumulator.tags["modded"] = True
+        assert Accumulator().tags == {}
+
+    def test_items_not_shared(self):
+        machine = AssemblingMachine()
+        machine.items.append({"id": {"name": "speed-module"}})
+        assert AssemblingMachine().items == []
+
+    def test_control_behavior_not_shared(self):
+        accumulator = Accumulator()
+        accumulator.control_behavior.output_signal = {
+            "name": "signal-B",
+            "type": "virtual",
+        }
+        assert Accumulator().control_behavior.output_signal.name == "signal-A"
+
+    def test_grid_not_shared(self):
+        spider = SpiderVehicle()
+        spider.grid.append({"equipment": {"name": "fusion-reactor-equipment"}})
+        assert SpiderVehicle().grid == []
@@ -532,6 +532,37 @@ class TestBlueprint:
         with pytest.raises(TypeError):
             blueprint.entities = "wrong"
 
+    def test_set_entities_adopt_or_copy(self):
+        # An orphaned EntityList (such as the result of a set operation) is
+        # adopted wholesale instead of being copied entity-by-entity
+        blueprint1 = Blueprint()
+        blueprint1.entities.append("wooden-chest")
+        blueprint2 = Blueprint()
+        blueprint2.entities.append("steel-chest", tile_position=(1, 0))
+
+        combined = blueprint1.entities.union(blueprint2.entities)
+        assert combined._parent is None
+
+        blueprint3 = Blueprint()
+        blueprint3.entities = combined
+        assert blueprint3.entities is combined
+        assert combined._parent is blueprint3
+        for entity in blueprint3.entities:
+            assert entity.parent is blueprint3
+        assert len(blueprint3.entities) == 2
+
+        # A list still attached to another blueprint is copied, leaving the
+        # original untouched
+        blueprint4 = Blueprint()
+        blueprint4.entities = blueprint1.entities
+        assert blueprint4.entities is not blueprint1.entities
+        assert blueprint4.entities[0] is not blueprint1.entities[0]
+        assert blueprint1.entities._parent is blueprint1
+        assert blueprint1.entities[0].parent is blueprint1
+
+        blueprint4.entities[0].bar = 1
+        assert blueprint1.entities[0].bar is None
+
     # =========================================================================
 
     def test_set_tiles(self):
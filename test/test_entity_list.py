@@ -64,6 +64,37 @@ class TestEntityList:
         with pytest.raises(ValueError):
             blueprint.entities.append(Container(), copy=False, merge=True)
 
+    def test_insert_negative_index(self):
+        # Negative (and out-of-range) indices must be normalized so that the
+        # key maps store the entity's true position
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest")
+        blueprint.entities.append("wooden-chest", tile_position=(2, 0))
+
+        blueprint.entities.insert(
+            -1, Container("steel-chest", tile_position=(4, 0), id="x")
+        )
+        assert blueprint.entities.key_to_idx == {"x": 1}
+        assert blueprint.entities.idx_to_key == {1: "x"}
+        assert blueprint.entities["x"] is blueprint.entities[1]
+
+        # Keyed entries at or above the insertion point shift with the insert
+        blueprint.entities.insert(
+            1, Container("steel-chest", tile_position=(6, 0), id="y")
+        )
+        assert blueprint.entities["y"] is blueprint.entities[1]
+        assert blueprint.entities["x"] is blueprint.entities[2]
+
+        # Indices clamp at either end, just like `list.insert`
+        blueprint.entities.insert(
+            -100, Container("steel-chest", tile_position=(8, 0), id="front")
+        )
+        assert blueprint.entities["front"] is blueprint.entities[0]
+        blueprint.entities.insert(
+            100, Container("steel-chest", tile_position=(10, 0), id="back")
+        )
+        assert blueprint.entities["back"] is blueprint.entities[-1]
+
     def test_remove(self):
         pass  # TODO
 
@@ -311,3 +342,62 @@ class TestEntityList:
         blueprint = Blueprint()
 
         assert blueprint.entities.validate(mode="none") == ValidationResult([], [])
+
+    def test_flattened_cache_invalidation(self):
+        # `to_dict` memoizes the flattened entity list; every mutating
+        # operation must discard that cache so later exports see the change
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest")
+        assert len(blueprint.to_dict()["blueprint"]["entities"]) == 1
+
+        # append
+        blueprint.entities.append("wooden-chest", tile_position=(1, 0))
+        assert len(blueprint.to_dict()["blueprint"]["entities"]) == 2
+
+        # __setitem__
+        blueprint.entities[0] = Container("steel-chest", tile_position=(2, 0))
+        assert blueprint.to_dict()["blueprint"]["entities"][0]["name"] == "steel-chest"
+
+        # __delitem__
+        del blueprint.entities[0]
+        result = blueprint.to_dict()["blueprint"]["entities"]
+        assert len(result) == 1
+        assert result[0]["name"] == "wooden-chest"
+
+        # validate() replaces `_root` wholesale; the memoized result must not
+        # keep pointing at the old list's contents
+        blueprint.entities.validate().reissue_all()
+        assert blueprint.entities.flattened()[0] is blueprint.entities[0]
+
+        # clear
+        blueprint.entities.clear()
+        assert "entities" not in blueprint.to_dict()["blueprint"]
+
+    def test_nested_group_cache_invalidation(self):
+        # Mutating a list nested inside two levels of groups must invalidate
+        # the caches of every ancestor list, all the way up to the blueprint
+        blueprint = Blueprint()
+        inner = Group("inner")
+        inner.entities.append("wooden-chest")
+        outer = Group("outer")
+        outer.entities.append(inner, copy=False)
+        blueprint.entities.append(outer, copy=False)
+
+        assert len(blueprint.to_dict()["blueprint"]["entities"]) == 1
+
+        blueprint.entities[("outer", "inner")].entities.append(
+            "wooden-chest", tile_position=(2, 0)
+        )
+        assert len(blueprint.to_dict()["blueprint"]["entities"]) == 2
+
+    def test_double_grid_aligned_cache(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest")
+        assert blueprint.entities.double_grid_aligned == False
+
+        blueprint.entities.append("straight-rail", tile_position=(10, 10))
+        assert blueprint.entities.double_grid_aligned == True
+
+        # Removing the only rail must flip the memoized value back
+        del blueprint.entities[-1]
+        assert blueprint.entities.double_grid_aligned == False